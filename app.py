@@ -1,11 +1,14 @@
 import streamlit as st
 import pandas as pd
 import numpy as np
-import plotly.express as px
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
+import copy
+import operator
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from math import isclose
+from types import MappingProxyType
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 
 from nba_api import NBAAPIClient
 from statistics import StatisticsEngine
@@ -23,7 +26,28 @@ from components.lambda_advisor import calculate_optimal_lambda
 # Import pages (functions now defined inline)
 # from pages.prediction_history import show_prediction_history_page
 # from pages.season_report import show_season_report_page
-from pages.pick_of_the_day import show_pick_of_the_day_page
+# Pick of the Day is imported lazily when its page is rendered
+
+# Season selector options, newest first (includes the upcoming 2025-2026 season)
+SEASON_YEARS = tuple(range(2025, 2019, -1))
+SEASON_DISPLAY = {year: f"{year}-{year+1}" for year in SEASON_YEARS}
+SEASON_DISPLAY_LIST = [SEASON_DISPLAY[year] for year in SEASON_YEARS]
+DISPLAY_TO_YEAR = {display: year for year, display in SEASON_DISPLAY.items()}
+
+# Static game-log charts: no mode bar, resize with the container
+PLOTLY_CHART_CONFIG = {'displayModeBar': False, 'responsive': True}
+
+# Prediction fallbacks when Advanced Settings hasn't stored its own values yet (read-only, built once)
+_DEFAULT_THRESHOLDS = MappingProxyType({'pts': (20,), 'reb': (8,), 'ast': (6,), 'fg3m': (3,)})
+_DEFAULT_LAMBDA_PARAMS = MappingProxyType({'early': 0.02, 'peak': 0.05, 'late': 0.08})
+
+# Display names for the predicted stats
+_STAT_DISPLAY = MappingProxyType({'pts': 'Points', 'reb': 'Rebounds', 'ast': 'Assists', 'fg3m': '3-Pointers'})
+
+# Player comparison chart: stats shown, one C-level getter for all of them, and per-stat scale (percentages x100)
+_COMPARISON_STATS = ('pts', 'reb', 'ast', 'fg_pct', 'fg3_pct')
+_get_comparison_stats = operator.itemgetter(*_COMPARISON_STATS)
+_COMPARISON_SCALE = np.array([1.0, 1.0, 1.0, 100.0, 100.0])
 
 def show_prediction_history_page(db):
     """Show prediction history page"""
@@ -126,7 +150,7 @@ def show_season_report_page(api_client, stats_engine, player_data):
             opponent = teams_lookup.get(opponent_id, 'N/A') if opponent_id else 'N/A'
             
             games_data.append({
-                'date': pd.to_datetime(game_date),
+                'date': game_date,
                 'opponent': f"{home_away} {opponent}",
                 'pts': game.get('pts', 0),
                 'reb': game.get('reb', 0),
@@ -142,6 +166,8 @@ def show_season_report_page(api_client, stats_engine, player_data):
         return
     
     games_df = pd.DataFrame(games_data)
+    # Parse every date in one vectorized call rather than one Timestamp per game
+    games_df['date'] = pd.to_datetime(games_df['date'], format='ISO8601')
     games_df = games_df.sort_values('date')
     
     # Date Range Filter
@@ -216,14 +242,17 @@ def show_season_report_page(api_client, stats_engine, player_data):
     }
     
     # Convert minutes to numeric if string
-    if filtered_df['min'].dtype == 'object':
+    if not pd.api.types.is_numeric_dtype(filtered_df['min']):
         filtered_df['min'] = pd.to_numeric(filtered_df['min'].str.replace(':', '.').str[:5], errors='coerce')
     
+    # One aggregation pass shared by the metrics, summary table, chart averages and anomaly check
+    stat_summary = filtered_df[stats_to_analyze].agg(['mean', 'median', 'std', 'min', 'max'])
+    
     # Display metrics in grid
     cols = st.columns(5)
     for idx, stat in enumerate(stats_to_analyze):
         with cols[idx]:
-            mean_val = filtered_df[stat].mean()
+            mean_val = stat_summary.at['mean', stat]
             st.metric(
                 stat_labels[stat],
                 f"{mean_val:.1f}",
@@ -236,11 +265,11 @@ def show_season_report_page(api_client, stats_engine, player_data):
         for stat in stats_to_analyze:
             stats_summary.append({
                 'Stat': stat_labels[stat],
-                'Mean': f"{filtered_df[stat].mean():.2f}",
-                'Median': f"{filtered_df[stat].median():.2f}",
-                'Std Dev': f"{filtered_df[stat].std():.2f}",
-                'Min': f"{filtered_df[stat].min():.2f}",
-                'Max': f"{filtered_df[stat].max():.2f}",
+                'Mean': f"{stat_summary.at['mean', stat]:.2f}",
+                'Median': f"{stat_summary.at['median', stat]:.2f}",
+                'Std Dev': f"{stat_summary.at['std', stat]:.2f}",
+                'Min': f"{stat_summary.at['min', stat]:.2f}",
+                'Max': f"{stat_summary.at['max', stat]:.2f}",
                 'Games': len(filtered_df)
             })
         
@@ -251,12 +280,25 @@ def show_season_report_page(api_client, stats_engine, player_data):
     # Line Charts
     st.subheader("📈 Performance Trends")
     
+    # Plotly is only imported by the pages that draw charts
+    import plotly.graph_objects as go
+    
+    # Dates are converted once and shared by all four charts
+    dates = pd.DatetimeIndex(filtered_df['date'])
+    date_ints = dates.asi8
+    
     for stat in ['pts', 'reb', 'ast', 'fg3m']:
         fig = go.Figure()
+        values = filtered_df[stat].to_numpy(dtype=np.float64, na_value=np.nan)
+        
+        # Guard only: the report loads at most 100 games (games_limit=100), well under
+        # CHART_MAX_POINTS, so today every point is plotted. LTTB kicks in if longer
+        # logs are ever fed in
+        plot_idx = stats_engine.downsample_lttb(date_ints, np.nan_to_num(values, nan=0.0))
         
-        fig.add_trace(go.Scatter(
-            x=filtered_df['date'],
-            y=filtered_df[stat],
+        fig.add_trace(go.Scattergl(
+            x=dates[plot_idx],
+            y=values[plot_idx],
             mode='lines+markers',
             name=stat_labels[stat],
             line=dict(width=2),
@@ -264,7 +306,7 @@ def show_season_report_page(api_client, stats_engine, player_data):
         ))
         
         # Add mean line
-        mean_val = filtered_df[stat].mean()
+        mean_val = stat_summary.at['mean', stat]
         fig.add_hline(
             y=mean_val,
             line_dash="dash",
@@ -278,10 +320,12 @@ def show_season_report_page(api_client, stats_engine, player_data):
             xaxis_title="Date",
             yaxis_title=stat_labels[stat],
             hovermode='x unified',
-            height=300
+            height=300,
+            transition_duration=0,
+            uirevision=player['id']
         )
         
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(fig, use_container_width=True, config=PLOTLY_CHART_CONFIG)
     
     st.divider()
     
@@ -294,10 +338,11 @@ def show_season_report_page(api_client, stats_engine, player_data):
         
         fig = go.Figure()
         
+        months = monthly_avg['month'].to_numpy()
         for stat in ['pts', 'reb', 'ast', 'fg3m']:
             fig.add_trace(go.Bar(
-                x=monthly_avg['month'],
-                y=monthly_avg[stat],
+                x=months,
+                y=monthly_avg[stat].to_numpy(),
                 name=stat_labels[stat]
             ))
         
@@ -306,10 +351,12 @@ def show_season_report_page(api_client, stats_engine, player_data):
             xaxis_title="Month",
             yaxis_title="Average Value",
             barmode='group',
-            height=400
+            height=400,
+            transition_duration=0,
+            uirevision=player['id']
         )
         
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(fig, use_container_width=True, config=PLOTLY_CHART_CONFIG)
         
         st.divider()
     
@@ -330,8 +377,8 @@ def show_season_report_page(api_client, stats_engine, player_data):
         
         # Check for statistical outliers (> 2 std dev)
         for stat in ['pts', 'reb', 'ast', 'fg3m']:
-            mean = filtered_df[stat].mean()
-            std = filtered_df[stat].std()
+            mean = stat_summary.at['mean', stat]
+            std = stat_summary.at['std', stat]
             
             if abs(row[stat] - mean) > 2 * std:
                 if row[stat] > mean:
@@ -353,7 +400,7 @@ def show_season_report_page(api_client, stats_engine, player_data):
     if anomalies:
         st.info(f"**🔍 {len(anomalies)} anomalies detected**")
         anomaly_df = pd.DataFrame(anomalies)
-        anomaly_df['date'] = pd.to_datetime(anomaly_df['date']).dt.strftime('%m/%d/%Y')
+        anomaly_df['date'] = anomaly_df['date'].dt.strftime('%m/%d/%Y')
         st.dataframe(anomaly_df, use_container_width=True, hide_index=True)
     else:
         st.success("✅ No significant anomalies detected")
@@ -370,22 +417,230 @@ def show_season_report_page(api_client, stats_engine, player_data):
         st.dataframe(display_df, use_container_width=True, hide_index=True)
 
 # Initialize session state
-if 'selected_player' not in st.session_state:
-    st.session_state.selected_player = None
-if 'player_data' not in st.session_state:
-    st.session_state.player_data = None
-if 'comparison_player' not in st.session_state:
-    st.session_state.comparison_player = None
-if 'comparison_data' not in st.session_state:
-    st.session_state.comparison_data = None
-if 'current_page' not in st.session_state:
-    st.session_state.current_page = 'Player Analysis'
-
-# Initialize API client and engines
-api_client = NBAAPIClient()
-stats_engine = StatisticsEngine()
-model = InverseFrequencyModel()
-db = NBADatabase()
+_DEFAULTS = {
+    'selected_player': None,
+    'player_data': None,
+    'comparison_player': None,
+    'comparison_data': None,
+    'current_page': 'Player Analysis',
+    'search_results': [],
+    'bio_fetch_failed': set(),  # player IDs whose bio lookup failed this session
+}
+st.session_state.update({
+    key: copy.copy(value) for key, value in _DEFAULTS.items() if key not in st.session_state
+})
+
+# Initialize API client and engines once per server process, not on every rerun
+@st.cache_resource
+def _get_api_client():
+    return NBAAPIClient()
+
+
+@st.cache_resource
+def _get_stats_engine():
+    return StatisticsEngine()
+
+
+@st.cache_resource
+def _get_model():
+    return InverseFrequencyModel()
+
+
+@st.cache_resource
+def _get_db():
+    return NBADatabase()
+
+
+@st.cache_resource
+def _recent_games_chart_template():
+    """Empty 2x2 Last-10 subplot grid, built once; callers copy it with go.Figure(template)"""
+    from plotly.subplots import make_subplots
+    return make_subplots(
+        rows=2, cols=2,
+        subplot_titles=('Points', 'Rebounds', 'Assists', 'Minutes Played'),
+        vertical_spacing=0.12
+    )
+
+
+api_client = _get_api_client()
+stats_engine = _get_stats_engine()
+model = _get_model()
+db = _get_db()
+
+
+@st.cache_data(ttl=600, show_spinner=False)
+def _search_players_cached(query):
+    """Player search results, cached so repeated autocomplete prefixes skip the API"""
+    return api_client.search_players(query)
+
+
+def _games_cache_key(player_id, games):
+    """Cheap cache key for a player's game list (game ids are unique per player)"""
+    return (player_id, tuple(game.get('id') for game in games))
+
+
+@st.cache_data(ttl=3600, max_entries=256, show_spinner=False)
+def _cached_inverse_frequency(games_key, _games_df, thresholds, alpha):
+    """Inverse-frequency probabilities, keyed on games_key instead of hashing the frame"""
+    return model.calculate_inverse_frequency_probabilities(_games_df, thresholds, alpha=alpha)
+
+
+@st.cache_data(ttl=3600, max_entries=256, show_spinner=False)
+def _cached_comprehensive_model(games_key, _games_df, season_stats, career_phase, thresholds, lambda_params):
+    """Career-phase regression model results, keyed on games_key instead of hashing the frame"""
+    return model.calculate_comprehensive_regression_model(
+        _games_df, season_stats, career_phase, thresholds, lambda_params
+    )
+
+
+@st.cache_data(ttl=3600, max_entries=256, show_spinner=False)
+def _cached_optimal_lambda(games_key, n_seasons, career_phase, _player, _career_stats, _recent_games, _season_stats):
+    """
+    Lambda advisor recommendation keyed on a small digest of what it reads.
+    
+    The advisor only looks at the game log (games_key), the number of seasons
+    (n_seasons) and the career phase, so the player, career and season dicts
+    are passed unhashed instead of being hashed on every rerun.
+    """
+    return calculate_optimal_lambda(
+        player=_player,
+        career_stats=_career_stats,
+        recent_games=_recent_games,
+        season_stats=_season_stats,
+        career_phase=career_phase
+    )
+
+
+@st.cache_data(ttl=3600, max_entries=1024, show_spinner=False)
+def _cached_career_phase(player_id, career_stats):
+    """Career phase for a player; career_stats is a short per-season list, cheap to hash"""
+    return stats_engine.calculate_career_phase(career_stats)
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _get_favorites_cached():
+    """Favorites list, cached across reruns and cleared when a favorite is added or removed"""
+    return db.get_favorites()
+
+
+def _player_stub_from_favorite(fav):
+    """
+    Build the player dict for a favorite without a player-info request.
+    
+    Uses the cached players row when available; otherwise synthesizes a minimal
+    stub from the favorites row. Bio details missing from a stub are fetched
+    when the Player Analysis header first renders.
+    """
+    cached_player = db.get_player(fav['player_id'])
+    if cached_player:
+        return cached_player
+    
+    first_name, _, last_name = fav['player_name'].partition(' ')
+    return {
+        'id': fav['player_id'],
+        'first_name': first_name,
+        'last_name': last_name,
+        'team': {'abbreviation': fav['team_abbreviation'], 'full_name': None}
+    }
+
+
+def safe_float_series(values, default=0.0) -> pd.Series:
+    """Convert values to float, replacing missing or non-numeric entries with default"""
+    return pd.to_numeric(pd.Series(values), errors='coerce').fillna(default)
+
+
+def parse_minutes_series(values) -> pd.Series:
+    """Convert minutes given as numbers or MM:SS strings to decimal minutes"""
+    values = pd.Series(values)
+    if pd.api.types.is_numeric_dtype(values):
+        return values.astype(np.float64).fillna(0.0)
+    minutes = pd.to_numeric(values, errors='coerce')
+    
+    # Parse MM:SS entries that are not already numeric
+    parts = values.astype(str).str.split(':', n=1, expand=True)
+    if parts.shape[1] == 2:
+        mm_ss = pd.to_numeric(parts[0], errors='coerce') + pd.to_numeric(parts[1], errors='coerce') / 60.0
+        minutes = minutes.fillna(mm_ss)
+    
+    return minutes.fillna(0.0)
+
+
+def _fetch_player_bundle(api_client, player_id, season, is_postseason, games_limit=100, player_name=None):
+    """
+    Fetch season stats, recent games and career stats for a player concurrently.
+    
+    The three requests run in a small thread pool, so the load takes as long as the
+    slowest call rather than the sum of all three. Playoff season stats are averaged
+    from the same games the recent-games call fetches, so they wait for it and are
+    read from the cache instead of requesting those games a second time.
+    
+    Args:
+        api_client: Instance of NBAAPIClient
+        player_id: Player ID
+        season: Season year
+        is_postseason: Whether to load playoff data
+        games_limit: Maximum number of games to load
+        player_name: Optional name used in user-facing error messages
+    
+    Returns:
+        dict with 'season_stats', 'recent_games', 'career_stats' and 'games_metadata'
+    """
+    def error_message(what):
+        return f"Unable to load {what} for {player_name}" if player_name else None
+    
+    # Worker threads need the script context so safe_api_call can show warnings
+    ctx = get_script_run_ctx()
+    with ThreadPoolExecutor(max_workers=3, initializer=add_script_run_ctx, initargs=(None, ctx)) as executor:
+        # Use smart loading to supplement with previous season if needed
+        games_future = executor.submit(
+            safe_api_call,
+            api_client.get_recent_games_smart,
+            player_id,
+            limit=games_limit, season=season, postseason=is_postseason,
+            default_return=([], {'supplemented': False, 'current_season_games': 0}),
+            error_message=error_message("recent games")
+        )
+        career_future = executor.submit(
+            safe_api_call,
+            api_client.get_career_stats,
+            player_id,
+            postseason=is_postseason,
+            default_return=[],
+            error_message=error_message("career stats")
+        )
+        if is_postseason:
+            # Playoff averages are built from the games the recent-games call caches
+            games_future.result()
+        season_future = executor.submit(
+            safe_api_call,
+            api_client.get_season_stats,
+            player_id, season,
+            postseason=is_postseason,
+            default_return=None,
+            error_message=error_message("season statistics")
+        )
+        
+        recent_games, games_metadata = games_future.result()
+        
+        return {
+            'season_stats': season_future.result(),
+            'recent_games': recent_games,
+            'career_stats': career_future.result(),
+            'games_metadata': games_metadata
+        }
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _cached_league_averages(season):
+    """League averages for a season, cached across reruns"""
+    return stats_engine.get_league_averages(season)
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _cached_z_scores(stats_tuple, season):
+    """Z-scores for one player's season stats (passed as sorted item tuple for hashing)"""
+    return stats_engine.calculate_z_scores_dict(dict(stats_tuple), _cached_league_averages(season))
+
 
 st.set_page_config(
     page_title="NBA Performance Predictor",
@@ -530,54 +785,52 @@ with col_feedback:
 
 st.divider()
 
-# Route to different pages based on selection FIRST
-current_page = st.session_state.current_page
+# Sidebar navigation: (page name, button label, key slug)
+_NAV_PAGES = (
+    ('Player Analysis', "🏀 Player Analysis", 'analysis'),
+    ('Season Report', "📅 Season Report", 'report'),
+    ('Prediction History', "📊 Prediction History", 'history'),
+    ('Pick of the Day', "🎯 Pick of the Day", 'picks'),
+)
+
 
-if current_page == 'Pick of the Day':
+def _render_navigation(current_page):
+    """Render sidebar buttons for every page except the current one"""
+    current_slug = next(slug for page, _, slug in _NAV_PAGES if page == current_page)
+    key_suffix = '' if current_page == 'Player Analysis' else f"_from_{current_slug}"
+    
+    st.subheader("Navigate")
+    for page, label, slug in _NAV_PAGES:
+        if page == current_page:
+            continue
+        if st.button(label, key=f"nav_to_{slug}{key_suffix}", use_container_width=True):
+            st.session_state.current_page = page
+            st.rerun()
+
+
+def _render_pick_of_the_day():
+    """Render the Pick of the Day page"""
     # Minimal sidebar - picks page has its own sidebar
     with st.sidebar:
-        # Navigation buttons
-        st.subheader("Navigate")
-        if st.button("🏀 Player Analysis", key="nav_to_analysis_from_picks", use_container_width=True):
-            st.session_state.current_page = 'Player Analysis'
-            st.rerun()
-        
-        if st.button("📅 Season Report", key="nav_to_report_from_picks", use_container_width=True):
-            st.session_state.current_page = 'Season Report'
-            st.rerun()
-        
-        if st.button("📊 Prediction History", key="nav_to_history_from_picks", use_container_width=True):
-            st.session_state.current_page = 'Prediction History'
-            st.rerun()
+        _render_navigation('Pick of the Day')
         
         st.divider()
     
     # Show page
     try:
+        from pages.pick_of_the_day import show_pick_of_the_day_page
         show_pick_of_the_day_page(api_client)
     except Exception as e:
         st.error(f"❌ Error loading Pick of the Day page: {str(e)}")
         import traceback
         st.code(traceback.format_exc())
-    st.stop()
 
-elif current_page == 'Prediction History':
+
+def _render_prediction_history():
+    """Render the Prediction History page"""
     # Minimal sidebar for Prediction History
     with st.sidebar:
-        # Navigation buttons
-        st.subheader("Navigate")
-        if st.button("🏀 Player Analysis", key="nav_to_analysis_from_history", use_container_width=True):
-            st.session_state.current_page = 'Player Analysis'
-            st.rerun()
-        
-        if st.button("📅 Season Report", key="nav_to_report_from_history", use_container_width=True):
-            st.session_state.current_page = 'Season Report'
-            st.rerun()
-        
-        if st.button("🎯 Pick of the Day", key="nav_to_picks_from_history", use_container_width=True):
-            st.session_state.current_page = 'Pick of the Day'
-            st.rerun()
-        
+        _render_navigation('Prediction History')
     
     # Show page
     try:
@@ -586,24 +839,13 @@ elif current_page == 'Prediction History':
         st.error(f"❌ Error loading Prediction History page: {str(e)}")
         import traceback
         st.code(traceback.format_exc())
-    st.stop()
 
-elif current_page == 'Season Report':
+
+def _render_season_report():
+    """Render the Season Report page with its own player search"""
     # Season Report sidebar with own player search
     with st.sidebar:
-        # Navigation buttons
-        st.subheader("Navigate")
-        if st.button("🏀 Player Analysis", key="nav_to_analysis_from_report", use_container_width=True):
-            st.session_state.current_page = 'Player Analysis'
-            st.rerun()
-        
-        if st.button("📊 Prediction History", key="nav_to_history_from_report", use_container_width=True):
-            st.session_state.current_page = 'Prediction History'
-            st.rerun()
-        
-        if st.button("🎯 Pick of the Day", key="nav_to_picks_from_report", use_container_width=True):
-            st.session_state.current_page = 'Pick of the Day'
-            st.rerun()
+        _render_navigation('Season Report')
         
         st.divider()
         
@@ -612,16 +854,13 @@ elif current_page == 'Season Report':
         report_search = st.text_input("Search Player", placeholder="Type player name...", key="report_search")
         
         # Season selection for report
-        season_years = list(range(2025, 2019, -1))
-        season_display = {year: f"{year}-{year+1}" for year in season_years}
-        
         report_season_display = st.selectbox(
             "Season", 
-            options=[season_display[year] for year in season_years],
+            options=SEASON_DISPLAY_LIST,
             index=0,
             key="report_season"
         )
-        report_season = int(report_season_display.split('-')[0])
+        report_season = DISPLAY_TO_YEAR[report_season_display]
         
         report_season_type = st.radio(
             "Type",
@@ -634,7 +873,7 @@ elif current_page == 'Season Report':
         
         # Search and load player for report
         if report_search and len(report_search) >= 2:
-            players = api_client.search_players(report_search)
+            players = _search_players_cached(report_search.lower().strip())
             
             if players:
                 player_options = {f"{p['first_name']} {p['last_name']} ({p['team']['abbreviation']})": p for p in players}
@@ -644,39 +883,20 @@ elif current_page == 'Season Report':
                     player = player_options[selected_name]
                     
                     with show_loading(f"Loading {player['first_name']} {player['last_name']}..."):
-                        # Fetch data specifically for Season Report
-                        season_stats = safe_api_call(
-                            api_client.get_season_stats,
-                            player['id'], report_season,
-                            postseason=report_is_postseason,
-                            default_return=None
-                        )
-                        
-                        all_games, report_games_metadata = safe_api_call(
-                            api_client.get_recent_games_smart,
-                            player['id'],
-                            limit=100,  # Get all games for season report
-                            season=report_season,
-                            postseason=report_is_postseason,
-                            default_return=([], {'supplemented': False, 'current_season_games': 0})
-                        )
-                        
-                        career_stats = safe_api_call(
-                            api_client.get_career_stats,
-                            player['id'],
-                            postseason=report_is_postseason,
-                            default_return=[]
+                        # Fetch data specifically for Season Report (all games for the season)
+                        bundle = _fetch_player_bundle(
+                            api_client, player['id'], report_season, report_is_postseason, games_limit=100
                         )
                         
                         # Store in separate session state for report
                         st.session_state.report_player_data = {
                             'player': player,
-                            'season_stats': season_stats,
-                            'all_games': all_games,
-                            'career_stats': career_stats,
+                            'season_stats': bundle['season_stats'],
+                            'all_games': bundle['recent_games'],
+                            'career_stats': bundle['career_stats'],
                             'season': report_season,
                             'is_postseason': report_is_postseason,
-                            'games_metadata': report_games_metadata
+                            'games_metadata': bundle['games_metadata']
                         }
                         
                         st.success(f"✅ Loaded {player['first_name']} {player['last_name']}!")
@@ -703,23 +923,28 @@ elif current_page == 'Season Report':
         st.error(f"❌ Error loading Season Report page: {str(e)}")
         import traceback
         st.code(traceback.format_exc())
+
+
+# Route to different pages based on selection FIRST; Player Analysis renders below
+PAGES = {
+    'Pick of the Day': _render_pick_of_the_day,
+    'Prediction History': _render_prediction_history,
+    'Season Report': _render_season_report,
+}
+
+page_renderer = PAGES.get(st.session_state.current_page)
+if page_renderer is not None:
+    page_renderer()
     st.stop()
 
 # Player Analysis Page (default) - Full sidebar
-with st.sidebar:
+# The search sections are fragments: submitting a query (Enter or leaving the box)
+# reruns only that part of the sidebar, and the Load buttons trigger a full rerun with st.rerun()
+@st.fragment
+def _render_player_search_sidebar():
+    """Navigation, favorites and player search for the Player Analysis sidebar"""
     # Navigation buttons to other pages
-    st.subheader("Navigate")
-    if st.button("📅 Season Report", key="nav_to_report", use_container_width=True):
-        st.session_state.current_page = 'Season Report'
-        st.rerun()
-    
-    if st.button("📊 Prediction History", key="nav_to_history", use_container_width=True):
-        st.session_state.current_page = 'Prediction History'
-        st.rerun()
-    
-    if st.button("🎯 Pick of the Day", key="nav_to_picks", use_container_width=True):
-        st.session_state.current_page = 'Pick of the Day'
-        st.rerun()
+    _render_navigation('Player Analysis')
     
     st.divider()
     
@@ -769,7 +994,7 @@ with st.sidebar:
 
 ### 📈 Prediction History
 
-**Save:** Click "💾 Save Predictions" after viewing  
+**Save:** Tick predictions, then click "💾 Save Selected"  
 **Track:** Navigate to Prediction History  
 **Verify:** Enter actual results after games
 
@@ -811,20 +1036,17 @@ All games from selected season (up to 100)
     st.divider()
     
     # Favorites quick access
-    favorites = db.get_favorites()
+    favorites = _get_favorites_cached()
     if favorites:
         with st.expander("⭐ Favorites"):
-            fav_season_years = list(range(2025, 2019, -1))
-            fav_season_display = {year: f"{year}-{year+1}" for year in fav_season_years}
-            
             fav_season_selected = st.selectbox(
                 "Season for Favorites", 
-                options=[fav_season_display[year] for year in fav_season_years],
+                options=SEASON_DISPLAY_LIST,
                 index=0,
                 key="fav_season_selector"
             )
-            # Extract the base year from display format
-            fav_season = int(fav_season_selected.split('-')[0])
+            # Map the display format back to the base year
+            fav_season = DISPLAY_TO_YEAR[fav_season_selected]
             
             fav_season_type = st.radio(
                 "Type",
@@ -840,43 +1062,18 @@ All games from selected season (up to 100)
                     # Load favorite player with error handling
                     with show_loading(f"Loading {fav['player_name']}..."):
                         try:
-                            player = safe_api_call(
-                                api_client.get_player_info,
-                                fav['player_id'],
-                                error_message=f"Unable to load player information for {fav['player_name']}"
-                            )
+                            player = _player_stub_from_favorite(fav)
                             
                             if player:
                                 st.session_state.selected_player = player
                                 st.session_state.selected_season = fav_season
                                 st.session_state.is_postseason = fav_is_postseason
                                 
-                                season_stats = safe_api_call(
-                                    api_client.get_season_stats,
-                                    player['id'], fav_season,
-                                    postseason=fav_is_postseason,
-                                    default_return=None
-                                )
-                                recent_games, games_metadata = safe_api_call(
-                                    api_client.get_recent_games_smart,
-                                    player['id'],
-                                    limit=100, season=fav_season, postseason=fav_is_postseason,
-                                    default_return=([], {'supplemented': False, 'current_season_games': 0})
-                                )
-                                career_stats = safe_api_call(
-                                    api_client.get_career_stats,
-                                    player['id'],
-                                    postseason=fav_is_postseason,
-                                    default_return=[]
+                                bundle = _fetch_player_bundle(
+                                    api_client, player['id'], fav_season, fav_is_postseason
                                 )
                                 
-                                st.session_state.player_data = {
-                                    'player': player,
-                                    'season_stats': season_stats,
-                                    'recent_games': recent_games,
-                                    'career_stats': career_stats,
-                                    'games_metadata': games_metadata
-                                }
+                                st.session_state.player_data = {'player': player, **bundle}
                                 st.success(f"✅ Loaded {fav['player_name']} successfully!")
                                 st.rerun()
                             else:
@@ -889,20 +1086,14 @@ All games from selected season (up to 100)
     search_query = st.text_input("Search Player Name", placeholder="Type player name (e.g., LeBron)...", key="player_search")
     
     # Season selection (display as "2024-2025" format)
-    current_year = datetime.now().year
-    season_year = current_year if datetime.now().month >= 10 else current_year - 1
-    # Include 2025 season (2025-2026) for upcoming season
-    season_years = list(range(2025, 2019, -1))
-    season_display = {year: f"{year}-{year+1}" for year in season_years}
-    
     selected_season_display = st.selectbox(
         "Select Season", 
-        options=[season_display[year] for year in season_years],
+        options=SEASON_DISPLAY_LIST,
         index=0,
         key="season_selector"
     )
-    # Extract the base year from the display format (e.g., "2024-2025" -> 2024)
-    selected_season = int(selected_season_display.split('-')[0])
+    # Map the display format back to the base year (e.g., "2024-2025" -> 2024)
+    selected_season = DISPLAY_TO_YEAR[selected_season_display]
     
     # Season Type selection (Regular Season vs Playoffs)
     season_type = st.radio(
@@ -914,13 +1105,9 @@ All games from selected season (up to 100)
     )
     is_postseason = (season_type == "Playoffs")
     
-    # Initialize search results storage
-    if 'search_results' not in st.session_state:
-        st.session_state.search_results = []
-    
     # Autocomplete: Search automatically as user types
     if search_query and len(search_query) >= 2:
-        players = api_client.search_players(search_query)
+        players = _search_players_cached(search_query.lower().strip())
         
         if players:
             # Store players for selection
@@ -948,38 +1135,12 @@ All games from selected season (up to 100)
                         st.session_state.is_postseason = is_postseason
                         
                         # Fetch comprehensive player data for selected season with error handling
-                        season_stats = safe_api_call(
-                            api_client.get_season_stats,
-                            player['id'], selected_season,
-                            postseason=is_postseason,
-                            default_return=None,
-                            error_message=f"Unable to load season statistics for {player_full_name}"
+                        bundle = _fetch_player_bundle(
+                            api_client, player['id'], selected_season, is_postseason,
+                            player_name=player_full_name
                         )
                         
-                        # Use smart loading to supplement with previous season if needed
-                        recent_games, games_metadata = safe_api_call(
-                            api_client.get_recent_games_smart,
-                            player['id'],
-                            limit=100, season=selected_season, postseason=is_postseason,
-                            default_return=([], {'supplemented': False, 'current_season_games': 0}),
-                            error_message=f"Unable to load recent games for {player_full_name}"
-                        )
-                        
-                        career_stats = safe_api_call(
-                            api_client.get_career_stats,
-                            player['id'],
-                            postseason=is_postseason,
-                            default_return=[],
-                            error_message=f"Unable to load career stats for {player_full_name}"
-                        )
-                        
-                        st.session_state.player_data = {
-                            'player': player,
-                            'season_stats': season_stats,
-                            'recent_games': recent_games,
-                            'career_stats': career_stats,
-                            'games_metadata': games_metadata  # Track multi-season info
-                        }
+                        st.session_state.player_data = {'player': player, **bundle}
                         
                         st.success(f"✅ Successfully loaded {player_full_name}!")
                         st.rerun()
@@ -991,29 +1152,23 @@ All games from selected season (up to 100)
             st.info("No players found. Try a different search term.")
     elif search_query and len(search_query) < 2:
         st.caption("Type at least 2 characters to search")
-    
-    st.divider()
-    
-    # Advanced Settings
-    show_advanced_settings()
-    
-    st.divider()
-    
+
+
+@st.fragment
+def _render_comparison_sidebar():
+    """Comparison player search for the Player Analysis sidebar"""
     # Comparison player search
     st.header("Player Comparison")
     comparison_query = st.text_input("Search Comparison Player", placeholder="Enter second player name...")
     
-    comp_season_years = list(range(2025, 2019, -1))
-    comp_season_display = {year: f"{year}-{year+1}" for year in comp_season_years}
-    
     comp_season_selected = st.selectbox(
         "Comparison Season", 
-        options=[comp_season_display[year] for year in comp_season_years],
+        options=SEASON_DISPLAY_LIST,
         index=0,
         key="comp_season_selector"
     )
-    # Extract the base year from display format
-    comp_season = int(comp_season_selected.split('-')[0])
+    # Map the display format back to the base year
+    comp_season = DISPLAY_TO_YEAR[comp_season_selected]
     
     comp_season_type = st.radio(
         "Comparison Season Type",
@@ -1026,7 +1181,7 @@ All games from selected season (up to 100)
     
     if comparison_query and len(comparison_query) >= 2:
         with st.spinner("Searching players..."):
-            comparison_players = api_client.search_players(comparison_query)
+            comparison_players = _search_players_cached(comparison_query.lower().strip())
         
         if comparison_players:
             comp_options = [f"{p['first_name']} {p['last_name']} ({p['team']['abbreviation']})" for p in comparison_players]
@@ -1042,62 +1197,147 @@ All games from selected season (up to 100)
                         st.session_state.comparison_season = comp_season
                         st.session_state.comp_is_postseason = comp_is_postseason
                         
-                        comp_season_stats = safe_api_call(
-                            api_client.get_season_stats,
-                            comp_player['id'], comp_season,
-                            postseason=comp_is_postseason,
-                            default_return=None
-                        )
-                        comp_recent_games, comp_games_metadata = safe_api_call(
-                            api_client.get_recent_games_smart,
-                            comp_player['id'],
-                            limit=100, season=comp_season, postseason=comp_is_postseason,
-                            default_return=([], {'supplemented': False, 'current_season_games': 0})
-                        )
-                        comp_career_stats = safe_api_call(
-                            api_client.get_career_stats,
-                            comp_player['id'],
-                            postseason=comp_is_postseason,
-                            default_return=[]
+                        comp_bundle = _fetch_player_bundle(
+                            api_client, comp_player['id'], comp_season, comp_is_postseason
                         )
                         
-                        st.session_state.comparison_data = {
-                            'player': comp_player,
-                            'season_stats': comp_season_stats,
-                            'recent_games': comp_recent_games,
-                            'career_stats': comp_career_stats,
-                            'games_metadata': comp_games_metadata
-                        }
+                        st.session_state.comparison_data = {'player': comp_player, **comp_bundle}
                         
                         st.success(f"✅ Loaded {comp_player_name} for comparison!")
+                        st.rerun()
                         
                     except Exception as e:
                         st.error(f"❌ Error loading comparison data: {str(e)}")
 
-# Route to different pages based on selection
-current_page = st.session_state.current_page
 
-if current_page == 'Prediction History':
-    # Show Prediction History page
-    try:
-        show_prediction_history_page(db)
-    except Exception as e:
-        st.error(f"❌ Error loading Prediction History page: {str(e)}")
-        import traceback
-        st.code(traceback.format_exc())
-    st.stop()  # Stop execution - don't render player analysis
+@st.fragment
+def _render_alpha_impact(probability_results, alpha):
+    """Weighted vs unweighted comparison; toggling it reruns only this fragment"""
+    col1, col2 = st.columns([1, 3])
+    with col1:
+        show_alpha_impact = st.checkbox("🔍 Show α Impact", value=False, help="Compare weighted vs unweighted probabilities to see alpha effect")
+    
+    # Show alpha impact comparison if enabled
+    if show_alpha_impact:
+        st.divider()
+        st.subheader("🔍 Alpha (α) Impact Analysis")
+        st.caption(f"Current α = {alpha:.2f} | Comparing Weighted vs Unweighted Probabilities")
+        
+        # Flatten every (stat, threshold) into parallel arrays so the difference,
+        # impact label and average are computed in one pass
+        impact_stats, impact_thresholds, weighted, unweighted = [], [], [], []
+        for stat, stat_results in probability_results.items():
+            impact_stats.extend([_STAT_DISPLAY.get(stat, stat)] * len(stat_results))
+            impact_thresholds.extend(stat_results.keys())
+            weighted.extend(data.get('weighted_frequency', 0) for data in stat_results.values())
+            unweighted.extend(data.get('frequency', 0) for data in stat_results.values())
+        
+        weighted = np.asarray(weighted, dtype=float) * 100
+        unweighted = np.asarray(unweighted, dtype=float) * 100
+        difference = weighted - unweighted
+        
+        if impact_stats:
+            impact_df = pd.DataFrame({
+                'Stat': impact_stats,
+                'Threshold': [f"≥{threshold}" for threshold in impact_thresholds],
+                'Unweighted (α=1.00)': [f"{value:.1f}%" for value in unweighted],
+                'Weighted (α={:.2f})'.format(alpha): [f"{value:.1f}%" for value in weighted],
+                'Difference': [f"{value:+.1f}%" for value in difference],
+                'Impact': np.select([difference > 10, difference < -10], ['🔥 Hot', '❄️ Cold'], '⚖️ Neutral')
+            })
+            st.dataframe(impact_df, use_container_width=True, hide_index=True)
+            
+            # Summary
+            avg_difference = float(np.abs(difference).mean())
+            if avg_difference < 3:
+                st.info(f"⚖️ **Low Impact:** Average difference {avg_difference:.1f}% - Player has consistent performance. α changes won't affect predictions much.")
+            elif avg_difference < 10:
+                st.success(f"📊 **Moderate Impact:** Average difference {avg_difference:.1f}% - α is having a noticeable effect on predictions.")
+            else:
+                st.warning(f"🔥 **High Impact:** Average difference {avg_difference:.1f}% - Strong recent trend! α is significantly affecting predictions.")
+        
+        st.divider()
 
-elif current_page == 'Season Report':
-    # Show Season Report page
-    try:
-        show_season_report_page(api_client, stats_engine, st.session_state.player_data)
-    except Exception as e:
-        st.error(f"❌ Error loading Season Report page: {str(e)}")
-        import traceback
-        st.code(traceback.format_exc())
-    st.stop()  # Stop execution - don't render player analysis
 
-# Player Analysis Page (default) - Continue below if neither page above matched
+@st.fragment
+def _render_save_predictions(player, probability_results):
+    """Save-predictions form; submitting it reruns only this fragment, not the models"""
+    st.divider()
+    st.subheader("💾 Save Predictions for Tracking")
+    st.caption("Save predictions to track accuracy over time")
+    
+    with st.expander("📝 Save These Predictions"):
+        # One form so ticking boxes doesn't rerun the page; a single submit saves the batch
+        with st.form("save_preds_form"):
+            # Date picker for next game
+            next_game_date = st.date_input(
+                "Next game date",
+                value=datetime.now() + timedelta(days=1),
+                key="next_game_date_main"
+            )
+            
+            # Select which predictions to save
+            st.write("**Select predictions to save:**")
+            
+            # One grid for the whole form: a column per stat, its thresholds stacked inside
+            selected = {}
+            stat_keys = [stat_key for stat_key in ('pts', 'reb', 'ast', 'fg3m') if stat_key in probability_results]
+            for stat_key, col in zip(stat_keys, st.columns(max(len(stat_keys), 1), gap='small')):
+                with col:
+                    st.write(f"**{_STAT_DISPLAY[stat_key]}:**")
+                    for threshold, data in sorted(probability_results[stat_key].items()):
+                        selected[(stat_key, threshold)] = st.checkbox(
+                            f"≥{threshold}: {data['weighted_frequency']*100:.0f}%",
+                            key=f"save_pred_{stat_key}_{threshold}",
+                            value=False
+                        )
+            
+            submitted = st.form_submit_button("💾 Save Selected")
+        
+        if submitted:
+            player_name = f"{player['first_name']} {player['last_name']}"
+            game_date = next_game_date.strftime('%Y-%m-%d')
+            season = st.session_state.get('selected_season', 2024)
+            rows = []
+            for (stat_key, threshold), save_this in selected.items():
+                if not save_this:
+                    continue
+                data = probability_results[stat_key][threshold]
+                rows.append({
+                    'player_id': player['id'],
+                    'player_name': player_name,
+                    'game_date': game_date,
+                    'season': season,
+                    'stat_type': stat_key,
+                    'threshold': threshold,
+                    'predicted_probability': data['weighted_frequency'],
+                    'confidence': data['prediction_confidence'] if 'prediction_confidence' in data else ("High" if data['n_exceeds'] >= 5 else "Low")
+                })
+            
+            if not rows:
+                st.warning("Select at least one prediction to save")
+            else:
+                try:
+                    prediction_ids = db.save_predictions_batch(rows)
+                    st.success(f"✅ Saved {len(prediction_ids)} prediction{'s' if len(prediction_ids) != 1 else ''}")
+                    st.info(f"💡 Go to **Prediction History** page to verify after the game!")
+                except Exception as e:
+                    st.error(f"❌ Failed to save predictions: {str(e)}")
+
+
+with st.sidebar:
+    _render_player_search_sidebar()
+    
+    st.divider()
+    
+    # Advanced Settings drive the predictions, so they rerun the whole page
+    show_advanced_settings()
+    
+    st.divider()
+    
+    _render_comparison_sidebar()
+
+# Player Analysis Page (default)
 # Main content area
 if st.session_state.player_data is None:
     st.info("👈 Search and select a player from the sidebar to begin analysis")
@@ -1112,41 +1352,75 @@ if st.session_state.player_data is None:
     - **Minutes Trend Analysis**: Track playing time patterns and sustainability
     """)
 else:
+    # Plotly is only imported once a player is loaded and there is something to chart
+    import plotly.graph_objects as go
+    
     player_info = st.session_state.player_data
     player = player_info['player']
+    
+    # Favorites load from a stub without bio details; fetch them once for the header.
+    # A failed lookup is remembered so a dead API isn't re-hit on every rerun
+    if 'position' not in player and player['id'] not in st.session_state.bio_fetch_failed:
+        full_player = safe_api_call(api_client.get_player_info, player['id'], default_return=None)
+        if full_player:
+            player = player_info['player'] = full_player
+        else:
+            st.session_state.bio_fetch_failed.add(player['id'])
+    
     season_stats = player_info['season_stats']
     recent_games = player_info['recent_games']
     
+    # Flatten the games once; the sections below take columns or subsets of this frame
+    games_df_raw = pd.json_normalize(recent_games, sep='_') if recent_games else pd.DataFrame()
+    
+    # Sort by game date once; the performance chart and minutes analysis both read this order
+    if 'game_date' in games_df_raw.columns:
+        games_df_sorted = (
+            games_df_raw
+            .assign(game_date=pd.to_datetime(games_df_raw['game_date'], format='ISO8601').dt.as_unit('s'))
+            .sort_values('game_date', kind='stable', ignore_index=True)
+        )
+    else:
+        games_df_sorted = games_df_raw
+    
+    # Minutes arrive as numbers or MM:SS strings; parse them once into decimal minutes.
+    # The column stays float64 for the models; charts take float32 copies
+    if 'min' in games_df_sorted.columns:
+        games_df_sorted = games_df_sorted.assign(min=parse_minutes_series(games_df_sorted['min']))
+    
     # Player info header
     col1, col2, col3 = st.columns([2, 2, 1])
     
     with col1:
         st.subheader(f"{player['first_name']} {player['last_name']}")
-        st.write(f"**Team**: {player['team']['full_name']}")
-        st.write(f"**Position**: {player['position'] if player['position'] else 'N/A'}")
+        st.markdown(
+            f"**Team**: {player['team'].get('full_name') or player['team'].get('abbreviation', 'N/A')}  \n"
+            f"**Position**: {player.get('position') or 'N/A'}"
+        )
     
     with col2:
         if player.get('height_feet') and player.get('height_inches'):
             height = f"{player['height_feet']}'{player['height_inches']}\""
         else:
             height = "N/A"
-        st.write(f"**Height**: {height}")
         weight = player.get('weight_pounds')
-        st.write(f"**Weight**: {weight} lbs" if weight else "**Weight**: N/A")
+        st.markdown(f"**Height**: {height}  \n**Weight**: {f'{weight} lbs' if weight else 'N/A'}")
     
     with col3:
         # Favorites and export buttons
         col_a, col_b = st.columns(2)
         
         with col_a:
-            is_favorite = db.is_favorite(player['id'])
+            is_favorite = any(fav['player_id'] == player['id'] for fav in _get_favorites_cached())
             if is_favorite:
                 if st.button("❤️ Remove Favorite"):
                     db.remove_favorite(player['id'])
+                    _get_favorites_cached.clear()
                     st.rerun()
             else:
                 if st.button("🤍 Add Favorite"):
                     db.add_favorite(player['id'], f"{player['first_name']} {player['last_name']}")
+                    _get_favorites_cached.clear()
                     st.rerun()
         
         with col_b:
@@ -1167,77 +1441,54 @@ else:
     with col_header:
         st.header(f"📊 Season Statistics ({display_season_formatted} {season_type_label})")
     with col_export:
-        # Export buttons
+        # Export buttons - the payload is only built when the download is clicked
         export_format = st.selectbox("Export", ["CSV", "JSON"], key="export_format_main")
-        if st.button("📥 Export Data", key="export_main"):
-            if export_format == "CSV":
-                csv_data = export_player_stats_csv(player, season_stats, recent_games)
-                st.download_button(
-                    label="Download CSV",
-                    data=csv_data,
-                    file_name=f"{player['last_name']}_{display_season}_stats.csv",
-                    mime="text/csv"
-                )
-            else:
-                json_data = export_player_stats_json(player, season_stats, recent_games)
-                st.download_button(
-                    label="Download JSON",
-                    data=json_data,
-                    file_name=f"{player['last_name']}_{display_season}_stats.json",
-                    mime="application/json"
-                )
+        if export_format == "CSV":
+            st.download_button(
+                label="📥 Export Data",
+                data=lambda: export_player_stats_csv(player, season_stats, recent_games),
+                file_name=f"{player['last_name']}_{display_season}_stats.csv",
+                mime="text/csv",
+                key="export_main"
+            )
+        else:
+            st.download_button(
+                label="📥 Export Data",
+                data=lambda: export_player_stats_json(player, season_stats, recent_games),
+                file_name=f"{player['last_name']}_{display_season}_stats.json",
+                mime="application/json",
+                key="export_main"
+            )
     
     if season_stats:
-        # Calculate league averages for z-score normalization
-        league_averages = stats_engine.get_league_averages(display_season)
-        
-        stats_df = pd.DataFrame([season_stats])
-        normalized_stats = stats_engine.calculate_z_scores(stats_df, league_averages)
-        
-        # Helper function to safely convert to float
-        def safe_float(value, default=0.0):
-            try:
-                return float(value) if value is not None else default
-            except (ValueError, TypeError):
-                return default
-        
-        # Helper function to convert MM:SS format to decimal minutes
-        def parse_minutes(min_str):
-            if not min_str:
-                return 0.0
-            try:
-                # If already a number, return it
-                return float(min_str)
-            except (ValueError, TypeError):
-                pass
-            try:
-                # Parse MM:SS format
-                if isinstance(min_str, str) and ':' in min_str:
-                    parts = min_str.split(':')
-                    minutes = int(parts[0])
-                    seconds = int(parts[1])
-                    return minutes + (seconds / 60.0)
-                return 0.0
-            except:
-                return 0.0
+        # Calculate league averages and z-scores (cached across reruns)
+        league_averages = _cached_league_averages(display_season)
+        normalized_stats = _cached_z_scores(tuple(sorted(season_stats.items())), display_season)
+        
+        # Convert all season averages in one pass (minutes may arrive as MM:SS)
+        season_values = safe_float_series(pd.Series({
+            stat: season_stats.get(stat)
+            for stat in ('pts', 'reb', 'ast', 'fg_pct', 'fg3_pct', 'ft_pct', 'games_played')
+        }, dtype=object))
+        season_values['min'] = parse_minutes_series([season_stats.get('min')]).iloc[0]
         
         col1, col2, col3, col4 = st.columns(4)
         
         with col1:
-            st.metric("Points per Game", f"{safe_float(season_stats['pts']):.1f}")
-            st.metric("Field Goal %", f"{safe_float(season_stats['fg_pct']) * 100:.1f}%")
+            st.metric("Points per Game", f"{season_values['pts']:.1f}")
+            st.metric("Field Goal %", f"{season_values['fg_pct'] * 100:.1f}%")
         
         with col2:
-            st.metric("Rebounds per Game", f"{safe_float(season_stats['reb']):.1f}")
-            st.metric("3-Point %", f"{safe_float(season_stats['fg3_pct']) * 100:.1f}%")
+            st.metric("Rebounds per Game", f"{season_values['reb']:.1f}")
+            st.metric("3-Point %", f"{season_values['fg3_pct'] * 100:.1f}%")
         
         with col3:
-            st.metric("Assists per Game", f"{safe_float(season_stats['ast']):.1f}")
-            st.metric("Free Throw %", f"{safe_float(season_stats['ft_pct']) * 100:.1f}%")
+            st.metric("Assists per Game", f"{season_values['ast']:.1f}")
+            st.metric("Free Throw %", f"{season_values['ft_pct'] * 100:.1f}%")
         
         with col4:
-            st.metric("Minutes per Game", f"{parse_minutes(season_stats['min']):.1f}")
-            st.metric("Games Played", f"{safe_float(season_stats['games_played'], 0):.0f}")
+            st.metric("Minutes per Game", f"{season_values['min']:.1f}")
+            st.metric("Games Played", f"{season_values['games_played']:.0f}")
     else:
         st.warning(f"⚠️ No season statistics available for {display_season_formatted}. The player may not have played in this season or data is unavailable.")
     
@@ -1256,98 +1507,74 @@ else:
     # Data quality check
     if not show_data_quality_warning(recent_games, "recent games", min_size=5):
         st.info("💡 **Suggestions:**")
-        st.write("• Try selecting a different season")
-        st.write("• Check if the player participated in this season type (Regular Season/Playoffs)")
-        st.write("• Verify the player was active during the selected season")
+        st.markdown(
+            "• Try selecting a different season  \n"
+            "• Check if the player participated in this season type (Regular Season/Playoffs)  \n"
+            "• Verify the player was active during the selected season"
+        )
     elif recent_games and len(recent_games) > 0:
-        # Extract nested game data and flatten structure
-        flattened_games = []
-        for game in recent_games:
-            flat_game = {
-                'date': game.get('game', {}).get('date'),
-                'pts': game.get('pts'),
-                'reb': game.get('reb'),
-                'ast': game.get('ast'),
-                'fg_pct': game.get('fg_pct'),
-                'fg3m': game.get('fg3m'),
-                'min': game.get('min')
-            }
-            flattened_games.append(flat_game)
-        
-        games_df = pd.DataFrame(flattened_games)
-        games_df['date'] = pd.to_datetime(games_df['date'])
-        
-        # Convert all numeric columns to float to avoid NaN plotting errors
-        numeric_cols = ['pts', 'reb', 'ast', 'fg_pct', 'fg3m', 'min']
-        for col in numeric_cols:
-            games_df[col] = pd.to_numeric(games_df[col], errors='coerce')
-        
-        games_df = games_df.sort_values('date').tail(10)  # Last 10 games
-        
-        # Create line chart for recent performance
-        fig = make_subplots(
-            rows=2, cols=2,
-            subplot_titles=('Points', 'Rebounds', 'Assists', 'Minutes Played'),
-            vertical_spacing=0.12
+        # Last 10 games by date, as one float32 array per stat (halves what Plotly ships)
+        last_10 = games_df_sorted.tail(10).reindex(columns=['game_date', 'pts', 'reb', 'ast', 'fg_pct', 'fg3m', 'min'])
+        dates = pd.DatetimeIndex(last_10['game_date'])
+        game_stats = {
+            stat: pd.to_numeric(last_10[stat], errors='coerce').to_numpy(dtype=np.float32)
+            for stat in ('pts', 'reb', 'ast', 'fg_pct', 'fg3m')
+        }
+        game_stats['min'] = last_10['min'].fillna(0.0).to_numpy(dtype=np.float32)
+        
+        # Create line chart for recent performance from a copy of the cached subplot grid
+        fig = go.Figure(_recent_games_chart_template())
+        
+        # One batched add_traces call instead of four add_trace round trips
+        panels = (('pts', 'Points', '#1f77b4'), ('reb', 'Rebounds', '#ff7f0e'),
+                  ('ast', 'Assists', '#2ca02c'), ('min', 'Minutes', '#d62728'))
+        fig.add_traces(
+            [go.Scattergl(x=dates, y=game_stats[stat], mode='lines+markers', name=name, line=dict(color=color))
+             for stat, name, color in panels],
+            rows=[1, 1, 2, 2], cols=[1, 2, 1, 2]
         )
         
-        fig.add_trace(go.Scatter(x=games_df['date'], y=games_df['pts'], 
-                                mode='lines+markers', name='Points', line=dict(color='#1f77b4')),
-                     row=1, col=1)
-        fig.add_trace(go.Scatter(x=games_df['date'], y=games_df['reb'],
-                                mode='lines+markers', name='Rebounds', line=dict(color='#ff7f0e')),
-                     row=1, col=2)
-        fig.add_trace(go.Scatter(x=games_df['date'], y=games_df['ast'],
-                                mode='lines+markers', name='Assists', line=dict(color='#2ca02c')),
-                     row=2, col=1)
-        fig.add_trace(go.Scatter(x=games_df['date'], y=games_df['min'],
-                                mode='lines+markers', name='Minutes', line=dict(color='#d62728')),
-                     row=2, col=2)
-        
         # Add season averages as horizontal lines (convert to float, parse minutes from MM:SS)
         if season_stats:
-            fig.add_hline(y=safe_float(season_stats['pts']), line_dash="dash", line_color="gray", row=1, col=1)
-            fig.add_hline(y=safe_float(season_stats['reb']), line_dash="dash", line_color="gray", row=1, col=2)
-            fig.add_hline(y=safe_float(season_stats['ast']), line_dash="dash", line_color="gray", row=2, col=1)
-            fig.add_hline(y=parse_minutes(season_stats['min']), line_dash="dash", line_color="gray", row=2, col=2)
+            fig.add_hline(y=season_values['pts'], line_dash="dash", line_color="gray", row=1, col=1)
+            fig.add_hline(y=season_values['reb'], line_dash="dash", line_color="gray", row=1, col=2)
+            fig.add_hline(y=season_values['ast'], line_dash="dash", line_color="gray", row=2, col=1)
+            fig.add_hline(y=season_values['min'], line_dash="dash", line_color="gray", row=2, col=2)
         
-        fig.update_layout(height=500, showlegend=False, title_text="Last 10 Games from Season (Dashed lines = Season Average)")
-        st.plotly_chart(fig, use_container_width=True)
+        fig.update_layout(height=500, showlegend=False, title_text="Last 10 Games from Season (Dashed lines = Season Average)",
+                          transition_duration=0, uirevision=player['id'])
+        st.plotly_chart(fig, use_container_width=True, config=PLOTLY_CHART_CONFIG)
         
         st.caption(f"ℹ️ Showing last 10 games for visualization. All {len(recent_games)} games from season loaded for analysis.")
         
         # Recent games table
-        display_games = games_df[['date', 'pts', 'reb', 'ast', 'fg_pct', 'fg3m', 'min']].copy()
-        display_games['date'] = display_games['date'].dt.strftime('%m/%d')
-        # Convert FG% to percentage format
-        display_games['fg_pct'] = display_games['fg_pct'] * 100
-        display_games.columns = ['Date', 'PTS', 'REB', 'AST', 'FG%', '3PM', 'MIN']
+        display_games = pd.DataFrame({
+            'PTS': game_stats['pts'],
+            'REB': game_stats['reb'],
+            'AST': game_stats['ast'],
+            'FG%': game_stats['fg_pct'] * 100,  # Convert FG% to percentage format
+            '3PM': game_stats['fg3m'],
+            'MIN': game_stats['min']
+        }).astype(np.float64).round(1)  # Back to float64 so float32 noise digits don't show
+        display_games.insert(0, 'Date', dates.strftime('%m/%d'))
         st.dataframe(display_games, use_container_width=True)
     
     # Minutes Played Analysis (simplified from Career Phase & Fatigue Analysis)
     st.header("⚡ Minutes Played Analysis")
     
     if recent_games and len(recent_games) >= 10:
-        # Flatten games data
-        flattened_games = []
-        for game in recent_games:
-            flat_game = {
-                'date': game.get('game', {}).get('date'),
-                'pts': game.get('pts'),
-                'min': game.get('min')
-            }
-            flattened_games.append(flat_game)
-        
-        games_df = pd.DataFrame(flattened_games)
-        games_df['date'] = pd.to_datetime(games_df['date'])
-        games_df = games_df.sort_values('date')
+        # Only minutes are needed. games_df_sorted is already in date order, so the
+        # projection leaves out the date column and analyze_minutes_trend skips its own sort
+        minutes = games_df_sorted.reindex(columns=['min'])['min'].fillna(0.0).to_numpy(dtype=np.float64)
         
         # Analyze minutes played trend
-        minutes_trend = model.analyze_minutes_trend(games_df)
+        minutes_trend = model.analyze_minutes_trend(pd.DataFrame({'min': minutes}))
+        
+        # Minutes Trend Chart - M4 bucketing keeps minute spikes visible on long histories
+        plot_idx = stats_engine.downsample_m4(np.arange(len(minutes)), minutes)
         
-        # Minutes Trend Chart
         fig = go.Figure()
-        fig.add_trace(go.Scatter(x=games_df.index, y=games_df['min'],
+        fig.add_trace(go.Scattergl(x=plot_idx, y=minutes[plot_idx].astype(np.float32),
                                mode='lines+markers', name='Minutes Played'))
         
         if minutes_trend['declining_trend']:
@@ -1355,8 +1582,8 @@ else:
                              x=0.5, y=0.9, xref="paper", yref="paper",
                              showarrow=False, bgcolor="yellow")
         
-        fig.update_layout(title="Minutes Played Trend", height=400)
-        st.plotly_chart(fig, use_container_width=True)
+        fig.update_layout(title="Minutes Played Trend", height=400, transition_duration=0, uirevision=player['id'])
+        st.plotly_chart(fig, use_container_width=True, config=PLOTLY_CHART_CONFIG)
         
         # Insights
         col1, col2 = st.columns(2)
@@ -1387,8 +1614,9 @@ else:
                     show_debug = st.checkbox("🔍 Show Debug Info", value=False, help="Show detailed debugging information about loaded games")
                 with col_debug2:
                     if st.button("🔄 Clear Cache", help="Clear ALL cached data (games, teams) and reload fresh from API"):
-                        from cache_sqlite import clear_cache
+                        from cache_sqlite import clear_cache, compact_cache
                         clear_cache()
+                        compact_cache()
                         st.success("✅ Cache cleared! All cached data removed.")
                         st.info("💡 Click 'Load Player Data' in the sidebar to fetch fresh data with correct team information.")
                 
@@ -1516,9 +1744,11 @@ else:
                 # Show debug information if enabled
                 if show_debug:
                     with st.expander("🔍 Debug: All Loaded Games", expanded=True):
-                        st.write(f"**Total games loaded:** {len(recent_games)}")
-                        st.write(f"**Looking for opponent:** {opponent_team}")
-                        st.write(f"**Games found vs {opponent_team}:** {len(opponent_games)}")
+                        st.markdown(
+                            f"**Total games loaded:** {len(recent_games)}  \n"
+                            f"**Looking for opponent:** {opponent_team}  \n"
+                            f"**Games found vs {opponent_team}:** {len(opponent_games)}"
+                        )
                         
                         if debug_info:
                             import pandas as pd
@@ -1568,43 +1798,36 @@ else:
             st.markdown("*Based on historical performance and custom thresholds from Advanced Settings*")
         
         # Get custom thresholds and calculate probabilities
-        thresholds = st.session_state.get('custom_thresholds', {
-            'pts': [20],
-            'reb': [8],
-            'ast': [6],
-            'fg3m': [3]
-        })
+        thresholds = st.session_state.get('custom_thresholds', _DEFAULT_THRESHOLDS)
         
         alpha = st.session_state.get('alpha', 0.85)
-        games_df = pd.DataFrame(filtered_recent_games)
+        games_key = _games_cache_key(player['id'], filtered_recent_games)
+        if filtered_recent_games is recent_games:
+            games_df = games_df_raw
+        else:
+            games_df = pd.json_normalize(filtered_recent_games, sep='_')
         
         # Calculate probabilities based on settings
         if use_career_phase:
             # Determine career phase
             career_stats = player_info.get('career_stats', [])
-            career_phase = stats_engine.calculate_career_phase(career_stats)
+            career_phase = _cached_career_phase(player['id'], career_stats)
             
             # Auto-calculate optimal lambda parameters
-            lambda_advice = calculate_optimal_lambda(
-                player=player,
-                career_stats=career_stats,
-                recent_games=recent_games,
-                season_stats=season_stats,
-                career_phase=career_phase
+            lambda_advice = _cached_optimal_lambda(
+                _games_cache_key(player['id'], recent_games),
+                len(career_stats) if career_stats else 0, career_phase,
+                player, career_stats, recent_games, season_stats
             )
             
             # Get lambda parameters from session state (may be auto or manual)
-            lambda_params = st.session_state.get('lambda_params', {
-                'early': 0.02,
-                'peak': 0.05,
-                'late': 0.08
-            })
+            lambda_params = st.session_state.get('lambda_params', _DEFAULT_LAMBDA_PARAMS)
             
             # Show clean lambda advisor panel
             current_lambda = lambda_params.get(career_phase, 0.05)
             
             # Check if using auto values
-            using_auto = abs(current_lambda - lambda_advice['recommended']) < 0.005
+            using_auto = isclose(current_lambda, lambda_advice['recommended'], abs_tol=0.005)
             
             with st.container():
                 # Compact recommendation display
@@ -1650,8 +1873,8 @@ else:
                     st.caption("💡 Adjust manually in Advanced Settings or click '✨ Auto' to apply recommendation")
             
             # Use comprehensive model with career phase
-            comprehensive_results = model.calculate_comprehensive_regression_model(
-                games_df, season_stats, career_phase, thresholds, lambda_params
+            comprehensive_results = _cached_comprehensive_model(
+                games_key, games_df, season_stats, career_phase, thresholds, lambda_params
             )
             
             # Extract weighted frequencies for display
@@ -1678,53 +1901,12 @@ else:
             
         else:
             # Use basic inverse-frequency model
-            probability_results = model.calculate_inverse_frequency_probabilities(
-                games_df, thresholds, alpha=alpha
+            probability_results = _cached_inverse_frequency(
+                games_key, games_df, thresholds, alpha
             )
         
         # Display predictions with alpha impact option
-        col1, col2 = st.columns([1, 3])
-        with col1:
-            show_alpha_impact = st.checkbox("🔍 Show α Impact", value=False, help="Compare weighted vs unweighted probabilities to see alpha effect")
-        
-        # Show alpha impact comparison if enabled
-        if show_alpha_impact:
-            st.divider()
-            st.subheader("🔍 Alpha (α) Impact Analysis")
-            st.caption(f"Current α = {alpha:.2f} | Comparing Weighted vs Unweighted Probabilities")
-            
-            impact_data = []
-            for stat, stat_results in probability_results.items():
-                stat_display = {'pts': 'Points', 'reb': 'Rebounds', 'ast': 'Assists', 'fg3m': '3-Pointers'}
-                for threshold, data in stat_results.items():
-                    weighted = data.get('weighted_frequency', 0) * 100
-                    unweighted = data.get('frequency', 0) * 100
-                    difference = weighted - unweighted
-                    
-                    impact_data.append({
-                        'Stat': stat_display.get(stat, stat),
-                        'Threshold': f"≥{threshold}",
-                        'Unweighted (α=1.00)': f"{unweighted:.1f}%",
-                        'Weighted (α={:.2f})'.format(alpha): f"{weighted:.1f}%",
-                        'Difference': f"{difference:+.1f}%",
-                        'Impact': '🔥 Hot' if difference > 10 else '❄️ Cold' if difference < -10 else '⚖️ Neutral'
-                    })
-            
-            if impact_data:
-                import pandas as pd
-                impact_df = pd.DataFrame(impact_data)
-                st.dataframe(impact_df, use_container_width=True, hide_index=True)
-                
-                # Summary
-                avg_difference = sum([abs(float(d['Difference'].replace('%','').replace('+',''))) for d in impact_data]) / len(impact_data)
-                if avg_difference < 3:
-                    st.info(f"⚖️ **Low Impact:** Average difference {avg_difference:.1f}% - Player has consistent performance. α changes won't affect predictions much.")
-                elif avg_difference < 10:
-                    st.success(f"📊 **Moderate Impact:** Average difference {avg_difference:.1f}% - α is having a noticeable effect on predictions.")
-                else:
-                    st.warning(f"🔥 **High Impact:** Average difference {avg_difference:.1f}% - Strong recent trend! α is significantly affecting predictions.")
-            
-            st.divider()
+        _render_alpha_impact(probability_results, alpha)
         
         # Show technical predictions with percentages
         show_all_predictions(probability_results)
@@ -1745,56 +1927,7 @@ else:
             """.format(alpha))
         
         # Save predictions section
-        st.divider()
-        st.subheader("💾 Save Predictions for Tracking")
-        st.caption("Save predictions to track accuracy over time")
-        
-        with st.expander("📝 Save These Predictions"):
-            # Date picker for next game
-            next_game_date = st.date_input(
-                "Next game date",
-                value=datetime.now() + timedelta(days=1),
-                key="next_game_date_main"
-            )
-            
-            # Select which predictions to save
-            st.write("**Select predictions to save:**")
-            
-            saved_count = 0
-            for stat_key in ['pts', 'reb', 'ast', 'fg3m']:
-                if stat_key in probability_results:
-                    stat_display = {'pts': 'Points', 'reb': 'Rebounds', 'ast': 'Assists', 'fg3m': '3-Pointers'}[stat_key]
-                    st.write(f"**{stat_display}:**")
-                    
-                    cols = st.columns(len(probability_results[stat_key]))
-                    for idx, (threshold, data) in enumerate(sorted(probability_results[stat_key].items())):
-                        with cols[idx]:
-                            save_this = st.checkbox(
-                                f"≥{threshold}: {data['weighted_frequency']*100:.0f}%",
-                                key=f"save_pred_{stat_key}_{threshold}",
-                                value=False
-                            )
-                            
-                            if save_this and st.button(f"💾 Save", key=f"btn_save_{stat_key}_{threshold}"):
-                                prediction_id = db.save_prediction(
-                                    player_id=player['id'],
-                                    player_name=f"{player['first_name']} {player['last_name']}",
-                                    game_date=next_game_date.strftime('%Y-%m-%d'),
-                                    season=st.session_state.get('selected_season', 2024),
-                                    stat_type=stat_key,
-                                    threshold=threshold,
-                                    predicted_probability=data['weighted_frequency'],
-                                    confidence=data['prediction_confidence'] if 'prediction_confidence' in data else ("High" if data['n_exceeds'] >= 5 else "Low")
-                                )
-                                
-                                if prediction_id:
-                                    st.success(f"✅ Saved! (ID: {prediction_id})")
-                                    saved_count += 1
-                                else:
-                                    st.error("❌ Failed to save")
-            
-            if saved_count > 0:
-                st.info(f"💡 Go to **Prediction History** page to verify after the game!")
+        _render_save_predictions(player, probability_results)
 
 # Player Comparison Section
 if st.session_state.comparison_data and st.session_state.player_data:
@@ -1806,47 +1939,63 @@ if st.session_state.comparison_data and st.session_state.player_data:
     player1 = player1_data['player']
     player2 = player2_data['player']
     
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        st.subheader(f"{player1['first_name']} {player1['last_name']}")
-        if player1_data['season_stats']:
-            stats1 = player1_data['season_stats']
-            st.metric("PPG", f"{stats1['pts']:.1f}")
-            st.metric("RPG", f"{stats1['reb']:.1f}")
-            st.metric("APG", f"{stats1['ast']:.1f}")
-            st.metric("FG%", f"{stats1['fg_pct'] * 100:.1f}%")
-    
-    with col2:
-        st.subheader(f"{player2['first_name']} {player2['last_name']}")
-        if player2_data['season_stats']:
-            stats2 = player2_data['season_stats']
-            st.metric("PPG", f"{stats2['pts']:.1f}")
-            st.metric("RPG", f"{stats2['reb']:.1f}")
-            st.metric("APG", f"{stats2['ast']:.1f}")
-            st.metric("FG%", f"{stats2['fg_pct'] * 100:.1f}%")
-    
+    # Single table instead of one metric widget per stat per player
+    def format_comparison_column(stats):
+        if not stats:
+            return ['N/A'] * 4
+        return [
+            f"{stats['pts']:.1f}",
+            f"{stats['reb']:.1f}",
+            f"{stats['ast']:.1f}",
+            f"{stats['fg_pct'] * 100:.1f}%"
+        ]
+
+    player1_name = f"{player1['first_name']} {player1['last_name']}"
+    player2_name = f"{player2['first_name']} {player2['last_name']}"
+    if player2_name == player1_name:
+        player2_name = f"{player2_name} (2)"
+
+    comparison_df = pd.DataFrame({
+        'Stat': ['PPG', 'RPG', 'APG', 'FG%'],
+        player1_name: format_comparison_column(player1_data['season_stats']),
+        player2_name: format_comparison_column(player2_data['season_stats'])
+    })
+    st.dataframe(comparison_df, use_container_width=True, hide_index=True)
+
     # Comparative bar chart
     if player1_data['season_stats'] and player2_data['season_stats']:
-        comparison_stats = ['pts', 'reb', 'ast', 'fg_pct', 'fg3_pct']
-        
-        # Convert percentages to proper format (multiply by 100)
-        def get_stat_value(stats, stat):
-            val = stats[stat]
-            return val * 100 if stat in ['fg_pct', 'fg3_pct'] else val
-        
-        fig = go.Figure(data=[
-            go.Bar(name=f"{player1['last_name']}", x=comparison_stats, 
-                   y=[get_stat_value(player1_data['season_stats'], stat) for stat in comparison_stats],
-                   marker_color='#1f77b4'),
-            go.Bar(name=f"{player2['last_name']}", x=comparison_stats,
-                   y=[get_stat_value(player2_data['season_stats'], stat) for stat in comparison_stats],
-                   marker_color='#ff7f0e')
-        ])
-        
-        fig.update_layout(barmode='group', title="Season Averages Comparison",
-                         xaxis_title="Statistics", yaxis_title="Values")
-        st.plotly_chart(fig, use_container_width=True)
+        # Reuse the figure from the previous rerun if neither player's stats changed
+        comp_fig_key = (
+            player1['id'], tuple(player1_data['season_stats'].items()),
+            player2['id'], tuple(player2_data['season_stats'].items())
+        )
+
+        if st.session_state.get('comp_fig_key') != comp_fig_key:
+            import plotly.graph_objects as go
+            
+            comparison_stats = list(_COMPARISON_STATS)
+
+            # Fetch all stats in one itemgetter call; percentages are scaled to 0-100
+            def get_stat_values(stats):
+                return np.array(_get_comparison_stats(stats), dtype=np.float64) * _COMPARISON_SCALE
+
+            fig = go.Figure(data=[
+                go.Bar(name=f"{player1['last_name']}", x=comparison_stats,
+                       y=get_stat_values(player1_data['season_stats']),
+                       marker_color='#1f77b4'),
+                go.Bar(name=f"{player2['last_name']}", x=comparison_stats,
+                       y=get_stat_values(player2_data['season_stats']),
+                       marker_color='#ff7f0e')
+            ])
+
+            fig.update_layout(barmode='group', title="Season Averages Comparison",
+                             xaxis_title="Statistics", yaxis_title="Values",
+                             transition_duration=0, uirevision=f"{player1['id']}-{player2['id']}")
+
+            st.session_state.comp_fig = fig
+            st.session_state.comp_fig_key = comp_fig_key
+
+        st.plotly_chart(st.session_state.comp_fig, use_container_width=True, config=PLOTLY_CHART_CONFIG)
 
 # Footer
 st.divider()
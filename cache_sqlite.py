@@ -4,36 +4,203 @@ Deterministic, persistent, auto-invalidating on schema mismatch.
 """
 
 from __future__ import annotations
+import functools
 import sqlite3
 import json
 import time
 import hashlib
-from typing import Optional
+import queue
+import threading
+import zlib
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Iterator, Optional
 
 # Constants
 SCHEMA_VER = "games:v2"  # bump when fields change
-REQUIRED_FIELDS = {"id", "date", "home_team_id", "visitor_team_id"}
+REQUIRED_FIELDS = frozenset({"id", "date", "home_team_id", "visitor_team_id"})
 DEFAULT_TTL_SECONDS = 6 * 3600  # 6 hours - shorten during dev
 DB_PATH = "cache.db"
 TABLE = "http_cache"
 
+# Reused for cache keys: json.dumps builds a new encoder whenever options are passed
+_PARAMS_ENCODER = json.JSONEncoder(sort_keys=True, separators=(',', ':'))
+_MEMO_PARAM_TYPES = (str, int, type(None))  # param value types cache_key memoizes
 
-def init_db(db_path: str = DB_PATH) -> None:
-    """Initialize cache database with required schema and security settings."""
-    conn = sqlite3.connect(db_path, timeout=10.0, check_same_thread=False)
-    cursor = conn.cursor()
+# Payloads above this size are stored zlib-compressed behind a one-byte marker
+# (plain JSON always starts with '{' or '[', so uncompressed rows stay readable)
+COMPRESS_MIN_BYTES = 1024
+_ZLIB_MAGIC = b'\x01'
+POOL_SIZE = 4  # long-lived connections kept open per database file
+OPTIMIZE_EVERY_WRITES = 500  # run PRAGMA optimize after this many writes...
+OPTIMIZE_INTERVAL_S = 900  # ...or once this many seconds have passed
+REAP_EVERY_WRITES = 256  # delete expired rows after this many writes
+REAP_AFTER_SECONDS = 24 * 3600  # longest TTL any reader uses (player info, teams)
+
+# Connection pool: db_path -> queue of connections (None marks a slot not opened yet)
+_POOL: dict[str, queue.LifoQueue] = {}
+_WRITE_LOCKS: dict[str, threading.Lock] = {}
+_POOL_LOCK = threading.Lock()
+
+# In-process LRU in front of SQLite: (db_path, key) -> (updated_at, schema_ver, payload_blob).
+# It holds the stored bytes rather than the dict so every hit decodes a private copy
+MEM_CACHE_MAX = 512
+_MEM_CACHE: OrderedDict[tuple[str, str], tuple[int, str, bytes | str]] = OrderedDict()
+_MEM_LOCK = threading.Lock()
+
+# PRAGMA optimize and expiry bookkeeping per db_path (updated under that database's write lock)
+_writes_since_optimize: dict[str, int] = {}
+_last_optimize_ts: dict[str, float] = {}
+_writes_since_reap: dict[str, int] = {}
+
+
+def _connect(db_path: str) -> sqlite3.Connection:
+    """Open a connection and apply the per-connection settings once."""
+    conn = sqlite3.connect(db_path, timeout=5.0, check_same_thread=False)
+    
+    # Free pages are returned with compact_cache() instead of a full VACUUM. SQLite only
+    # honours this on a new, empty file (and it must come before the WAL switch);
+    # existing files pick it up at their next clear_cache(vacuum=True)
+    conn.execute("PRAGMA auto_vacuum=INCREMENTAL")
     
     # Enable WAL mode for better concurrency
-    cursor.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA wal_autocheckpoint=1000")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA mmap_size=268435456")  # 256MB
+    conn.execute("PRAGMA cache_size=-20000")  # ~20MB page cache
     
     # Security: Limit cache size
-    cursor.execute("PRAGMA max_page_count=50000")  # ~200MB limit
+    conn.execute("PRAGMA max_page_count=50000")  # ~200MB limit
+    
+    return conn
+
+
+def _pool_for(db_path: str) -> queue.LifoQueue:
+    """Return the connection pool for db_path, creating it on first use."""
+    pool = _POOL.get(db_path)
+    if pool is None:
+        with _POOL_LOCK:
+            pool = _POOL.get(db_path)
+            if pool is None:
+                # Every connection to ":memory:" is its own database, so share one
+                size = 1 if db_path == ":memory:" else POOL_SIZE
+                pool = queue.LifoQueue(maxsize=size)
+                for _ in range(size):
+                    pool.put(None)
+                _WRITE_LOCKS[db_path] = threading.Lock()
+                _POOL[db_path] = pool
+    return pool
+
+
+@contextmanager
+def _get_conn(db_path: str = DB_PATH, write: bool = False) -> Iterator[sqlite3.Connection]:
+    """
+    Borrow a pooled connection for db_path.
+    
+    Writes are serialized by a per-database lock and run in one transaction
+    that commits on success and rolls back on error.
+    """
+    pool = _pool_for(db_path)
+    conn = pool.get()
+    try:
+        if conn is None:
+            conn = _connect(db_path)
+        if write:
+            with _WRITE_LOCKS[db_path], conn:
+                yield conn
+        else:
+            yield conn
+    finally:
+        pool.put(conn)
+
+
+def _maybe_optimize(conn: sqlite3.Connection, db_path: str, n_writes: int = 1) -> None:
+    """Count writes to db_path and refresh its planner statistics every N writes or M seconds."""
+    writes = _writes_since_optimize.get(db_path, 0) + n_writes
+    now = time.monotonic()
+    last_ts = _last_optimize_ts.setdefault(db_path, now)
+    if writes >= OPTIMIZE_EVERY_WRITES or now - last_ts > OPTIMIZE_INTERVAL_S:
+        conn.execute("PRAGMA optimize")
+        writes = 0
+        _last_optimize_ts[db_path] = now
+    _writes_since_optimize[db_path] = writes
+
+
+def _maybe_reap(conn: sqlite3.Connection, db_path: str, now: int, n_writes: int = 1) -> None:
+    """Count writes to db_path and delete rows too old for any reader every N writes."""
+    writes = _writes_since_reap.get(db_path, 0) + n_writes
+    if writes >= REAP_EVERY_WRITES:
+        # Range delete on idx_http_cache_updated keeps the table and its indices small
+        conn.execute(f"DELETE FROM {TABLE} WHERE updated_at < ?", (now - REAP_AFTER_SECONDS,))
+        writes = 0
+    _writes_since_reap[db_path] = writes
+
+
+def _remember(db_path: str, key: str, updated_at: int, schema_ver: str, payload_blob: bytes | str) -> None:
+    """Store an encoded payload in the in-process LRU, evicting the least recently used entry."""
+    with _MEM_LOCK:
+        _MEM_CACHE[(db_path, key)] = (updated_at, schema_ver, payload_blob)
+        _MEM_CACHE.move_to_end((db_path, key))
+        if len(_MEM_CACHE) > MEM_CACHE_MAX:
+            _MEM_CACHE.popitem(last=False)
+
+
+def close_connections(db_path: str = DB_PATH) -> None:
+    """
+    Close every pooled connection for db_path (e.g. before deleting the file).
+    
+    Waits for borrowed connections to be returned, so don't call it while holding
+    one. The pool and write lock stay registered; later calls reconnect lazily.
+    """
+    pool = _POOL.get(db_path)
+    if pool is None:
+        return
+    
+    # Take every slot (blocking on borrowed ones), close what was opened and hand
+    # back empty slots. _POOL_LOCK stops two closers from each holding half the pool
+    with _POOL_LOCK:
+        slots = [pool.get() for _ in range(pool.maxsize)]
+        try:
+            for conn in slots:
+                if conn is not None:
+                    conn.close()
+        finally:
+            for _ in slots:
+                pool.put(None)
+
+
+def _encode_payload(payload: dict) -> bytes:
+    """Serialize a payload to the bytes stored in the BLOB column, compressing large ones."""
+    raw = json.dumps(payload, separators=(',', ':')).encode('utf-8')
+    if len(raw) < COMPRESS_MIN_BYTES:
+        return raw
+    return _ZLIB_MAGIC + zlib.compress(raw, 3)
+
+
+def _decode_payload(payload_blob: bytes | str) -> dict:
+    """Inverse of _encode_payload; also reads rows stored as TEXT by older versions."""
+    if isinstance(payload_blob, bytes) and payload_blob[:1] == _ZLIB_MAGIC:
+        payload_blob = zlib.decompress(payload_blob[1:])
+    return json.loads(payload_blob)
+
+
+def init_db(db_path: str = DB_PATH) -> None:
+    """Initialize cache database with required schema and security settings."""
+    with _get_conn(db_path, write=True) as conn:
+        _create_schema(conn)
+
+
+def _create_schema(conn: sqlite3.Connection) -> None:
+    """Create the cache table and indices if they don't exist."""
+    cursor = conn.cursor()
     
     # Create table
     cursor.execute(f"""
         CREATE TABLE IF NOT EXISTS {TABLE}(
             key TEXT PRIMARY KEY,
-            payload TEXT NOT NULL,
+            payload BLOB NOT NULL,
             updated_at INTEGER NOT NULL,
             schema_ver TEXT NOT NULL
         )
@@ -45,13 +212,14 @@ def init_db(db_path: str = DB_PATH) -> None:
         ON {TABLE}(updated_at)
     """)
     
+    # Point lookups check schema and age from the index; the payload is only read on a hit
     cursor.execute(f"""
-        CREATE INDEX IF NOT EXISTS idx_http_cache_schema 
-        ON {TABLE}(schema_ver)
+        CREATE INDEX IF NOT EXISTS idx_http_cache_lookup 
+        ON {TABLE}(key, schema_ver, updated_at)
     """)
     
-    conn.commit()
-    conn.close()
+    # Superseded by idx_http_cache_lookup (point queries go by key)
+    cursor.execute("DROP INDEX IF EXISTS idx_http_cache_schema")
 
 
 def cache_key(namespace: str, params: dict, schema_ver: str = SCHEMA_VER) -> str:
@@ -64,22 +232,38 @@ def cache_key(namespace: str, params: dict, schema_ver: str = SCHEMA_VER) -> str
         schema_ver: Schema version string
     
     Returns:
-        SHA256 hex digest
+        32-char hex digest (SHA-256 truncated to 128 bits; an identity hash only)
     """
+    # Memoize the common case of flat str/int params. Other value types (lists,
+    # floats, bools) hash equal to values that serialize differently, e.g. True == 1
+    if all(type(value) in _MEMO_PARAM_TYPES for value in params.values()):
+        return _cache_key_memo(namespace, tuple(sorted(params.items())), schema_ver)
+    return _compute_cache_key(namespace, params, schema_ver)
+
+
+@functools.lru_cache(maxsize=4096)
+def _cache_key_memo(namespace: str, params_items: tuple, schema_ver: str) -> str:
+    """cache_key for hashable params, keyed on their sorted items."""
+    return _compute_cache_key(namespace, dict(params_items), schema_ver)
+
+
+def _compute_cache_key(namespace: str, params: dict, schema_ver: str) -> str:
+    """Serialize and hash; the uncached body of cache_key."""
     # Sort params for deterministic serialization
-    sorted_params = json.dumps(params, sort_keys=True, separators=(',', ':'))
+    sorted_params = _PARAMS_ENCODER.encode(params)
     
     # Combine namespace + schema + params
     canonical = f"{namespace}|{schema_ver}|{sorted_params}"
     
     # Hash
-    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()[:32]
 
 
 def get_cached(
     key: str, 
     max_age_s: int = DEFAULT_TTL_SECONDS, 
-    db_path: str = DB_PATH
+    db_path: str = DB_PATH,
+    schema_ver: str = SCHEMA_VER
 ) -> Optional[dict]:
     """
     Retrieve cached payload if valid.
@@ -88,40 +272,47 @@ def get_cached(
         key: Cache key
         max_age_s: Maximum age in seconds (TTL)
         db_path: Database path
+        schema_ver: Expected schema version of the entry
     
     Returns:
-        Cached dict or None if miss/expired/schema mismatch
+        Cached dict or None if miss/expired/schema mismatch. Each call returns
+        a fresh dict, so callers may modify it.
     """
-    conn = sqlite3.connect(db_path, timeout=5.0, check_same_thread=False)
-    cursor = conn.cursor()
-    
-    cursor.execute(
-        f"SELECT payload, updated_at, schema_ver FROM {TABLE} WHERE key = ?",
-        (key,)
-    )
+    now = int(time.time())
     
-    row = cursor.fetchone()
-    conn.close()
+    # In-process LRU first; a stale or mismatched entry falls through to SQLite
+    with _MEM_LOCK:
+        entry = _MEM_CACHE.get((db_path, key))
+        if entry is not None:
+            _MEM_CACHE.move_to_end((db_path, key))
+    if entry is not None:
+        mem_updated_at, mem_schema_ver, payload_blob = entry
+        if mem_schema_ver == schema_ver and (now - mem_updated_at) <= max_age_s:
+            return _decode_payload(payload_blob)
+    
+    # Schema and TTL are checked against idx_http_cache_lookup, so a stale or mismatched
+    # payload is never read. INDEXED BY because the planner otherwise picks the primary
+    # key index and reads the table row (payload overflow pages included) to test them
+    with _get_conn(db_path) as conn:
+        row = conn.execute(
+            f"SELECT payload, updated_at FROM {TABLE} INDEXED BY idx_http_cache_lookup "
+            f"WHERE key = ? AND schema_ver = ? AND updated_at >= ?",
+            (key, schema_ver, now - max_age_s)
+        ).fetchone()
     
     if not row:
         return None
     
-    payload_str, updated_at, cached_schema_ver = row
-    
-    # Check schema version
-    if cached_schema_ver != SCHEMA_VER:
-        return None
-    
-    # Check TTL
-    now = int(time.time())
-    if (now - updated_at) > max_age_s:
-        return None
+    payload_blob, updated_at = row
     
     # Deserialize and return
     try:
-        return json.loads(payload_str)
-    except json.JSONDecodeError:
+        payload = _decode_payload(payload_blob)
+    except (json.JSONDecodeError, UnicodeDecodeError, zlib.error):
         return None
+    
+    _remember(db_path, key, updated_at, schema_ver, payload_blob)
+    return payload
 
 
 def set_cached(
@@ -139,39 +330,78 @@ def set_cached(
         schema_ver: Schema version
         db_path: Database path
     """
+    set_cached_many([(key, payload)], schema_ver=schema_ver, db_path=db_path)
+
+
+def set_cached_many(
+    items: list[tuple[str, dict]],
+    schema_ver: str = SCHEMA_VER,
+    db_path: str = DB_PATH
+) -> None:
+    """
+    Store several (key, payload) pairs in one transaction.
+    
+    Every payload is serialized and size-checked before anything is written,
+    so an oversized entry leaves the cache untouched.
+    
+    Args:
+        items: (key, payload) pairs
+        schema_ver: Schema version
+        db_path: Database path
+    """
+    items = list(items)
+    
     # Validate payload size (prevent cache bloat)
-    payload_str = json.dumps(payload, separators=(',', ':'))
-    if len(payload_str) > 5_000_000:  # 5MB limit per entry
+    rows = [(key, _encode_payload(payload)) for key, payload in items]
+    if any(len(payload_blob) > 5_000_000 for _, payload_blob in rows):  # 5MB stored limit per entry
         raise ValueError("Payload too large for caching")
     
-    conn = sqlite3.connect(db_path, timeout=5.0, check_same_thread=False)
-    cursor = conn.cursor()
+    if not rows:
+        return
     
     now = int(time.time())
     
-    cursor.execute(
-        f"""
-        INSERT OR REPLACE INTO {TABLE} (key, payload, updated_at, schema_ver)
-        VALUES (?, ?, ?, ?)
-        """,
-        (key, payload_str, now, schema_ver)
-    )
+    with _get_conn(db_path, write=True) as conn:
+        conn.executemany(
+            f"""
+            INSERT OR REPLACE INTO {TABLE} (key, payload, updated_at, schema_ver)
+            VALUES (?, ?, ?, ?)
+            """,
+            [(key, payload_blob, now, schema_ver) for key, payload_blob in rows]
+        )
+        _maybe_optimize(conn, db_path, len(rows))
+        _maybe_reap(conn, db_path, now, len(rows))
     
-    conn.commit()
-    conn.close()
+    for key, payload_blob in rows:
+        _remember(db_path, key, now, schema_ver, payload_blob)
 
 
-def clear_cache(db_path: str = DB_PATH) -> None:
-    """Delete all cache entries."""
-    conn = sqlite3.connect(db_path, timeout=5.0, check_same_thread=False)
-    cursor = conn.cursor()
-    cursor.execute(f"DELETE FROM {TABLE}")
+def clear_cache(db_path: str = DB_PATH, vacuum: bool = False) -> None:
+    """
+    Delete all cache entries.
     
-    # Vacuum to reclaim space
-    cursor.execute("VACUUM")
+    Freed pages stay in the file for reuse. Pass vacuum=True to rebuild the file
+    as well; VACUUM rewrites the whole database and blocks every other connection
+    while it runs, so keep it for explicit maintenance.
+    """
+    with _get_conn(db_path, write=True) as conn:
+        conn.execute(f"DELETE FROM {TABLE}")
     
-    conn.commit()
-    conn.close()
+    with _MEM_LOCK:
+        for mem_key in [mem_key for mem_key in _MEM_CACHE if mem_key[0] == db_path]:
+            del _MEM_CACHE[mem_key]
+    
+    if vacuum:
+        # Must run outside the delete's transaction
+        with _get_conn(db_path, write=True) as conn:
+            conn.execute("VACUUM")
+
+
+def compact_cache(db_path: str = DB_PATH, pages: int = 1000) -> None:
+    """Return up to `pages` free pages to the filesystem (cheap; needs auto_vacuum=INCREMENTAL)."""
+    with _get_conn(db_path, write=True) as conn:
+        # execute() steps the pragma only once (one page); executescript runs it to completion
+        conn.executescript(f"PRAGMA incremental_vacuum({int(pages)})")
 
 
 def validate_games_schema(games: list[dict]) -> None:
@@ -185,8 +415,9 @@ def validate_games_schema(games: list[dict]) -> None:
         ValueError: If any game is missing required fields
     """
     for i, game in enumerate(games):
-        if not REQUIRED_FIELDS.issubset(game.keys()):
-            missing = REQUIRED_FIELDS - set(game.keys())
+        # issubset/difference read the dict's keys directly; no set is built on success
+        if not REQUIRED_FIELDS.issubset(game):
+            missing = set(REQUIRED_FIELDS.difference(game))
             raise ValueError(
                 f"CACHE_SCHEMA_MISMATCH: Game {i} missing fields: {missing}"
             )
@@ -195,22 +426,19 @@ def validate_games_schema(games: list[dict]) -> None:
 # Self-tests
 def main():
     """Run self-tests for cache functionality."""
-    import os
-    import tempfile
-    
     print("Running cache_sqlite.py self-tests...")
     
-    # Use temporary database for tests
-    test_db = os.path.join(tempfile.gettempdir(), "test_cache.db")
-    
-    # Clean up any existing test db
-    if os.path.exists(test_db):
-        os.remove(test_db)
+    # In-memory database: no files or fsyncs. The pool keeps a single connection
+    # for ":memory:", so every helper below sees the same database
+    test_db = ":memory:"
     
     # Test 1: init_db
     print("\n[OK] Test 1: init_db()")
     init_db(test_db)
-    assert os.path.exists(test_db), "Database file should exist"
+    with _get_conn(test_db) as conn:
+        assert conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (TABLE,)
+        ).fetchone(), "Cache table should exist"
     
     # Test 2: cache_key determinism
     print("[OK] Test 2: cache_key() determinism")
@@ -219,7 +447,12 @@ def main():
     key1 = cache_key("test:namespace", params1)
     key2 = cache_key("test:namespace", params2)
     assert key1 == key2, "Keys should be identical regardless of param order"
-    assert len(key1) == 64, "SHA256 should produce 64-char hex string"
+    assert len(key1) == 32, "Keys should be 32-char hex strings"
+    assert key1 == _compute_cache_key("test:namespace", params1, SCHEMA_VER), "Memoized key should match"
+    list_params = {"player_ids": [1, 2]}
+    assert cache_key("test:namespace", list_params) == _compute_cache_key("test:namespace", list_params, SCHEMA_VER)
+    assert cache_key("test:namespace", {"flag": True}) != cache_key("test:namespace", {"flag": 1}), \
+        "Values that compare equal but serialize differently need distinct keys"
     
     # Test 3: set_cached / get_cached round-trip
     print("[OK] Test 3: set_cached() / get_cached() round-trip")
@@ -229,13 +462,54 @@ def main():
     retrieved = get_cached(test_key, db_path=test_db)
     assert retrieved == test_payload, "Payload should match"
     
+    # Test 3b: set_cached_many writes every entry in one go
+    print("[OK] Test 3b: set_cached_many()")
+    batch = [(cache_key("test:batch", {"i": i}), {"i": i}) for i in range(5)]
+    set_cached_many(batch, db_path=test_db)
+    for key, payload in batch:
+        assert get_cached(key, db_path=test_db) == payload, "Batched payload should match"
+    
+    # Test 3b2: large payloads are stored compressed; plain JSON rows still decode
+    print("[OK] Test 3b2: payload compression")
+    big_payload = {"games": [{"id": i, "date": "2024-01-01"} for i in range(200)]}
+    big_blob = _encode_payload(big_payload)
+    assert big_blob[:1] == _ZLIB_MAGIC, "Large payloads should be compressed"
+    assert len(big_blob) < len(json.dumps(big_payload)), "Compressed blob should be smaller"
+    assert _decode_payload(big_blob) == big_payload, "Compressed payload should round-trip"
+    assert _decode_payload(json.dumps(big_payload).encode('utf-8')) == big_payload, "Plain JSON should still decode"
+    
+    # Test 3c: repeat reads are served from the in-process LRU
+    print("[OK] Test 3c: in-process LRU")
+    with _get_conn(test_db, write=True) as conn:
+        conn.execute(f"DELETE FROM {TABLE} WHERE key = ?", (test_key,))
+    assert get_cached(test_key, db_path=test_db) == test_payload, "LRU should serve the payload"
+    get_cached(test_key, db_path=test_db)["count"] = 99
+    assert get_cached(test_key, db_path=test_db) == test_payload, "LRU hits should not share the payload"
+    test_payload["count"] = 99
+    set_cached(test_key + "_copy", test_payload, db_path=test_db)
+    test_payload["count"] = 1
+    assert get_cached(test_key + "_copy", db_path=test_db)["count"] == 99, "LRU should keep what was stored"
+    
+    # Test 3d: the reaper deletes rows older than REAP_AFTER_SECONDS
+    print("[OK] Test 3d: expired row reaper")
+    stale_key = cache_key("test:stale", {"id": 1})
+    with _get_conn(test_db, write=True) as conn:
+        conn.execute(
+            f"INSERT INTO {TABLE} (key, payload, updated_at, schema_ver) VALUES (?, ?, ?, ?)",
+            (stale_key, _encode_payload({}), int(time.time()) - REAP_AFTER_SECONDS - 1, SCHEMA_VER)
+        )
+    _writes_since_reap[test_db] = REAP_EVERY_WRITES - 1
+    set_cached(cache_key("test:reap", {"id": 1}), {"data": "new"}, db_path=test_db)
+    with _get_conn(test_db) as conn:
+        assert conn.execute(f"SELECT 1 FROM {TABLE} WHERE key = ?", (stale_key,)).fetchone() is None, \
+            "Reaper should delete expired rows"
+    
     # Test 4: TTL expiry
     print("[OK] Test 4: TTL expiry behavior")
     expired_key = cache_key("test:expired", {"id": 999})
     set_cached(expired_key, {"data": "old"}, db_path=test_db)
-    time.sleep(1)  # Wait for 1 second to ensure TTL can expire
-    # Check with 0 second TTL - should return None
-    result = get_cached(expired_key, max_age_s=0, db_path=test_db)
+    # A negative TTL puts the cutoff in the future, so the entry is expired without sleeping
+    result = get_cached(expired_key, max_age_s=-1, db_path=test_db)
     assert result is None, "Expired cache should return None"
     
     # Test 5: Schema version mismatch
@@ -245,6 +519,9 @@ def main():
     # Try to retrieve with current SCHEMA_VER
     result = get_cached(mismatch_key, db_path=test_db)
     assert result is None, "Schema mismatch should return None"
+    # Entries written with their own schema version are readable with it
+    result = get_cached(mismatch_key, db_path=test_db, schema_ver="old:v1")
+    assert result == {"data": "test"}, "Matching schema version should hit"
     
     # Test 6: validate_games_schema
     print("[OK] Test 6: validate_games_schema()")
@@ -269,8 +546,56 @@ def main():
     result = get_cached(test_key, db_path=test_db)
     assert result is None, "Cache should be empty after clear"
     
+    # Test 8: compact_cache returns the cleared pages
+    print("[OK] Test 8: compact_cache()")
+    set_cached_many([(cache_key("test:bulk", {"i": i}), {"blob": "x" * 4000}) for i in range(50)],
+                    db_path=test_db)
+    clear_cache(test_db)
+    with _get_conn(test_db) as conn:
+        assert conn.execute("PRAGMA auto_vacuum").fetchone()[0] == 2, "New files should use incremental auto_vacuum"
+        free_before = conn.execute("PRAGMA freelist_count").fetchone()[0]
+    compact_cache(test_db)
+    with _get_conn(test_db) as conn:
+        free_after = conn.execute("PRAGMA freelist_count").fetchone()[0]
+    assert free_before > 0 and free_after == 0, "compact_cache should release free pages"
+    clear_cache(test_db, vacuum=True)
+    
+    # Test 9: close_connections waits for borrowed connections and keeps the write lock
+    print("[OK] Test 9: close_connections()")
+    import os
+    import shutil
+    import tempfile
+    tmp_dir = tempfile.mkdtemp()
+    file_db = os.path.join(tmp_dir, "close_test.db")
+    init_db(file_db)
+    write_lock = _WRITE_LOCKS[file_db]
+    borrowed = threading.Event()
+    release = threading.Event()
+    
+    def _borrow():
+        with _get_conn(file_db):
+            borrowed.set()
+            release.wait()
+    
+    holder = threading.Thread(target=_borrow)
+    holder.start()
+    borrowed.wait()
+    closer = threading.Thread(target=close_connections, args=(file_db,))
+    closer.start()
+    closer.join(timeout=0.2)
+    assert closer.is_alive(), "close_connections should wait for the borrowed connection"
+    release.set()
+    holder.join()
+    closer.join()
+    assert _WRITE_LOCKS[file_db] is write_lock, "Writers should keep sharing one lock"
+    assert _writes_since_reap.get(file_db, 0) == 0, "Write counters should be kept per database"
+    set_cached(test_key, test_payload, db_path=file_db)
+    assert get_cached(test_key, db_path=file_db) == test_payload, "Pool should reconnect after close"
+    close_connections(file_db)
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+    
     # Clean up
-    os.remove(test_db)
+    close_connections(test_db)
     
     print("\n[SUCCESS] All tests passed!")
 
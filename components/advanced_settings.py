@@ -7,10 +7,44 @@ Provides interactive controls for:
 - Career phase decay parameters
 """
 
+import functools
+from types import MappingProxyType
+
 import streamlit as st
 from components.lambda_advisor import get_lambda_rule_of_thumb
 
 
+@functools.lru_cache(maxsize=64)
+def _build_settings(pts_threshold, reb_threshold, ast_threshold, fg3m_threshold,
+                    alpha, use_career_phase, lambda_early, lambda_peak, lambda_late):
+    """
+    Session-state values for one combination of settings widgets.
+    
+    Memoized so unchanged widgets hand back the same read-only objects on every
+    rerun instead of rebuilding the threshold and lambda dicts.
+    """
+    return MappingProxyType({
+        # Single threshold per category, kept as a sequence for compatibility
+        'custom_thresholds': MappingProxyType({
+            'pts': (pts_threshold,),
+            'reb': (reb_threshold,),
+            'ast': (ast_threshold,),
+            'fg3m': (fg3m_threshold,)
+        }),
+        'alpha': alpha,
+        'use_career_phase': use_career_phase,
+        # Slider values are stored separately so they persist
+        'lambda_early_value': lambda_early,
+        'lambda_peak_value': lambda_peak,
+        'lambda_late_value': lambda_late,
+        'lambda_params': MappingProxyType({
+            'early': lambda_early,
+            'peak': lambda_peak,
+            'late': lambda_late
+        })
+    })
+
+
 def show_advanced_settings():
     """
     Display advanced settings panel with threshold sliders and career phase parameters.
@@ -133,23 +167,13 @@ def show_advanced_settings():
             lambda_peak = current_lambda_peak
             lambda_late = current_lambda_late
         
-        # Store slider values separately so they persist
-        st.session_state.lambda_early_value = lambda_early
-        st.session_state.lambda_peak_value = lambda_peak
-        st.session_state.lambda_late_value = lambda_late
+        settings = _build_settings(
+            pts_threshold, reb_threshold, ast_threshold, fg3m_threshold,
+            alpha_value, use_career_phase, lambda_early, lambda_peak, lambda_late
+        )
         
-        # Store single threshold per category as a list for compatibility
-        st.session_state.custom_thresholds = {
-            'pts': [pts_threshold],
-            'reb': [reb_threshold],
-            'ast': [ast_threshold],
-            'fg3m': [fg3m_threshold]
-        }
-        st.session_state.alpha = alpha_value
-        st.session_state.use_career_phase = use_career_phase
-        st.session_state.lambda_params = {
-            'early': lambda_early,
-            'peak': lambda_peak,
-            'late': lambda_late
-        }
+        # Only write keys whose object changed; unchanged widgets reuse the memoized objects
+        for key, value in settings.items():
+            if st.session_state.get(key) is not value:
+                st.session_state[key] = value
 
@@ -9,10 +9,88 @@ Automatically recommends optimal λ (decay rate) parameters based on:
 - Injury/load management patterns
 """
 
-import pandas as pd
+import math
+
 import numpy as np
 from datetime import datetime
 
+import config
+
+# Factor 1: base λ and reasoning by career phase. Anything else gets the balanced
+# peak value (deliberately not config.LAMBDA_UNKNOWN, which the career-phase weights use)
+_PHASE_BASE = {
+    'early': (config.LAMBDA_EARLY, "Early career - low decay to capture growth trajectory"),
+    'rising': (config.LAMBDA_RISING, "Rising player - moderate decay to weight recent improvement"),
+    'peak': (config.LAMBDA_PEAK, "Peak performance - balanced decay"),
+    'late': (config.LAMBDA_LATE, "Late career - higher decay to focus on current form"),
+}
+_UNKNOWN_PHASE_BASE = (config.LAMBDA_PEAK, "Unknown phase - using balanced default")
+
+
+def _numeric_values(games, field):
+    """
+    Float array of games[i][field], skipping missing and non-numeric entries.
+    
+    Matches pd.to_numeric(errors='coerce').dropna() without building a DataFrame.
+    """
+    def values():
+        for game in games:
+            try:
+                value = float(game.get(field))
+            except (TypeError, ValueError):
+                continue
+            if value == value:  # drop NaN
+                yield value
+    
+    return np.fromiter(values(), dtype=np.float64)
+
+
+def _coefficient_of_variation(values):
+    """
+    Sample std / mean of a short series in one Welford pass (0 when the mean is not positive).
+    
+    Plain Python floats: at ~20 values this is several times faster than NumPy's
+    per-call dispatch for mean() and std().
+    """
+    count = 0
+    mean = 0.0
+    m2 = 0.0
+    for x in values.tolist():
+        count += 1
+        delta = x - mean
+        mean += delta / count
+        m2 += (x - mean) * delta
+    
+    if count < 2 or mean <= 0:
+        return 0
+    return math.sqrt(m2 / (count - 1)) / mean
+
+
+def _minutes_summary(minutes):
+    """(DNP count, mean of the last 5 games, mean of all games) in one pass over the minutes."""
+    dnp_count = 0
+    total = 0.0
+    for m in minutes:
+        if m < 1:
+            dnp_count += 1
+        total += m
+    
+    recent = minutes[-5:]
+    return dnp_count, sum(recent) / len(recent), total / len(minutes)
+
+
+def _parse_min(m):
+    """Decimal minutes from a number or MM:SS string; missing or unparseable values count as 0"""
+    # The API sends MM:SS strings, so test for str first
+    if isinstance(m, str):
+        if ':' in m:
+            parts = m.split(':')
+            return int(parts[0]) + int(parts[1]) / 60.0
+        return 0.0
+    if isinstance(m, (int, float, np.number)):
+        return 0.0 if m != m else float(m)
+    return 0.0
+
 
 def calculate_optimal_lambda(player, career_stats, recent_games, season_stats, career_phase):
     """
@@ -36,28 +114,13 @@ def calculate_optimal_lambda(player, career_stats, recent_games, season_stats, c
         }
     """
     # Base lambda values
-    lambda_early = 0.02
-    lambda_peak = 0.05
-    lambda_late = 0.08
-    
-    reasoning_parts = []
+    lambda_early = config.LAMBDA_EARLY
+    lambda_peak = config.LAMBDA_PEAK
+    lambda_late = config.LAMBDA_LATE
     
     # Factor 1: Career Phase (primary)
-    if career_phase == 'early':
-        recommended = 0.02
-        reasoning_parts.append("Early career - low decay to capture growth trajectory")
-    elif career_phase == 'rising':
-        recommended = 0.03
-        reasoning_parts.append("Rising player - moderate decay to weight recent improvement")
-    elif career_phase == 'peak':
-        recommended = 0.05
-        reasoning_parts.append("Peak performance - balanced decay")
-    elif career_phase == 'late':
-        recommended = 0.08
-        reasoning_parts.append("Late career - higher decay to focus on current form")
-    else:
-        recommended = 0.05
-        reasoning_parts.append("Unknown phase - using balanced default")
+    recommended, phase_reason = _PHASE_BASE.get(career_phase, _UNKNOWN_PHASE_BASE)
+    reasoning_parts = [phase_reason]
     
     # Factor 2: Age adjustment
     if career_stats and len(career_stats) > 0:
@@ -80,16 +143,20 @@ def calculate_optimal_lambda(player, career_stats, recent_games, season_stats, c
     else:
         age_adjustment = 0
     
+    # Factors 3 and 4 read the game log and both need at least 10 games
+    has_games = recent_games is not None and len(recent_games) >= 10
+    variance_adjustment = 0
+    load_adjustment = 0
+    
     # Factor 3: Recent performance variance
-    if recent_games and len(recent_games) >= 10:
+    if has_games:
         try:
-            games_df = pd.DataFrame(recent_games)
-            if 'pts' in games_df.columns:
-                pts_values = pd.to_numeric(games_df['pts'], errors='coerce').dropna()
+            if any('pts' in game for game in recent_games):
+                pts_values = _numeric_values(recent_games, 'pts')
                 
                 if len(pts_values) >= 10:
-                    # Calculate coefficient of variation
-                    cv = pts_values.std() / pts_values.mean() if pts_values.mean() > 0 else 0
+                    # Calculate coefficient of variation (sample std, as pandas computes it)
+                    cv = _coefficient_of_variation(pts_values)
                     
                     if cv > 0.4:
                         # High variance - increase decay to focus on recent
@@ -99,59 +166,30 @@ def calculate_optimal_lambda(player, career_stats, recent_games, season_stats, c
                         variance_adjustment = 0.01
                         reasoning_parts.append(f"Moderate variance (CV={cv:.2f}) - slight decay increase")
                     else:
-                        variance_adjustment = 0
                         reasoning_parts.append(f"Low variance (CV={cv:.2f}) - consistent performance")
-                else:
-                    variance_adjustment = 0
-            else:
-                variance_adjustment = 0
         except:
             variance_adjustment = 0
-    else:
-        variance_adjustment = 0
     
     # Factor 4: Minutes played trend (load management detection)
-    if recent_games and len(recent_games) >= 10:
+    if has_games:
         try:
-            games_df = pd.DataFrame(recent_games)
-            if 'min' in games_df.columns:
-                # Parse minutes
-                def parse_min(m):
-                    if pd.isna(m):
-                        return 0
-                    if isinstance(m, (int, float)):
-                        return float(m)
-                    if isinstance(m, str) and ':' in m:
-                        parts = m.split(':')
-                        return int(parts[0]) + int(parts[1]) / 60.0
-                    return 0
+            if any('min' in game for game in recent_games):
+                # Parse minutes (one per game, so at least 10)
+                minutes = [_parse_min(game.get('min')) for game in recent_games]
                 
-                minutes = games_df['min'].apply(parse_min)
+                # Check for DNPs or significant minute reductions
+                dnp_count, recent_5, season_avg = _minutes_summary(minutes)
                 
-                if len(minutes) >= 10:
-                    # Check for DNPs or significant minute reductions
-                    dnp_count = (minutes < 1).sum()
-                    recent_5 = minutes.tail(5).mean()
-                    season_avg = minutes.mean()
-                    
-                    if dnp_count >= 3:
-                        # Load management detected
-                        load_adjustment = 0.04
-                        reasoning_parts.append(f"Load management detected ({dnp_count} DNPs) - high decay")
-                    elif season_avg > 0 and recent_5 < season_avg * 0.7:
-                        # Minutes declining significantly
-                        load_adjustment = 0.02
-                        reasoning_parts.append(f"Minutes declining (recent: {recent_5:.1f}, avg: {season_avg:.1f}) - increased decay")
-                    else:
-                        load_adjustment = 0
-                else:
-                    load_adjustment = 0
-            else:
-                load_adjustment = 0
+                if dnp_count >= 3:
+                    # Load management detected
+                    load_adjustment = 0.04
+                    reasoning_parts.append(f"Load management detected ({dnp_count} DNPs) - high decay")
+                elif season_avg > 0 and recent_5 < season_avg * 0.7:
+                    # Minutes declining significantly
+                    load_adjustment = 0.02
+                    reasoning_parts.append(f"Minutes declining (recent: {recent_5:.1f}, avg: {season_avg:.1f}) - increased decay")
         except:
             load_adjustment = 0
-    else:
-        load_adjustment = 0
     
     # Calculate final recommended lambda (with bounds)
     recommended = recommended + age_adjustment + variance_adjustment + load_adjustment
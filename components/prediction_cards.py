@@ -19,22 +19,26 @@ def show_prediction_card(stat_name, emoji, probability_results, stat_key):
         probability_results: Dictionary containing prediction data
         stat_key: Key for the stat in probability_results (e.g., "pts")
     """
-    if stat_key in probability_results:
-        st.subheader(f"{emoji} {stat_name}")
-        for threshold, data in sorted(probability_results[stat_key].items()):
-            success_prob = data['weighted_frequency']
-            confidence = "High" if data['n_exceeds'] >= 5 else "Low"
-            
-            # Apply Bayesian smoothing if available
-            if data.get('bayesian_smoothed'):
-                bayes = data['bayesian_smoothed']
-                success_prob = bayes['smoothed_probability']
-            
-            # Clean, simple metric display - just show percentage
-            st.metric(
-                f"≥ {threshold} {stat_name.lower()}",
-                f"{success_prob*100:.1f}%"
-            )
+    stat_results = probability_results.get(stat_key)
+    if stat_results is None:
+        return
+    
+    st.subheader(f"{emoji} {stat_name}")
+    label = stat_name.lower()
+    
+    for threshold, data in sorted(stat_results.items()):
+        success_prob = data['weighted_frequency']
+        
+        # Apply Bayesian smoothing if available
+        bayes = data.get('bayesian_smoothed')
+        if bayes:
+            success_prob = bayes['smoothed_probability']
+        
+        # Clean, simple metric display - just show percentage
+        st.metric(
+            f"≥ {threshold} {label}",
+            f"{success_prob*100:.1f}%"
+        )
 
 
 def show_all_predictions(probability_results):
@@ -3,10 +3,30 @@ Simplified, user-friendly prediction cards for NBA player performance
 Replaces technical jargon with actionable insights and betting recommendations
 """
 
+import html
+
 import streamlit as st
+import numpy as np
 import pandas as pd
 from typing import Dict, List, Any
 
+# Card lookup tables, built once at import rather than on every card
+_STAT_DISPLAY = {
+    'pts': 'Points',
+    'reb': 'Rebounds',
+    'ast': 'Assists',
+    'fg3m': '3-Pointers Made',
+    'fg3a': '3-Pointers Attempted',
+    'fgm': 'Field Goals Made',
+    'fga': 'Field Goals Attempted',
+    'ftm': 'Free Throws Made',
+    'fta': 'Free Throws Attempted',
+    'stl': 'Steals',
+    'blk': 'Blocks',
+    'tov': 'Turnovers',
+    'pf': 'Personal Fouls'
+}
+
 def get_performance_indicator(regression_prob: float, recent_frequency: float, threshold: float) -> tuple:
     """
     Determine performance indicator and betting recommendation
@@ -38,14 +58,26 @@ def get_performance_indicator(regression_prob: float, recent_frequency: float, t
     
     return indicator_emoji, indicator_text, bet_rec, risk_level
 
-def get_confidence_level(confidence: str) -> tuple:
-    """Convert confidence to user-friendly terms"""
-    confidence_map = {
-        "High": ("✅", "HIGH"),
-        "Medium": ("⚠️", "MEDIUM"), 
-        "Low": ("❌", "LOW")
-    }
-    return confidence_map.get(confidence, ("❓", "UNKNOWN"))
+# get_performance_indicator outcomes by probability band. _classify_probs maps each
+# probability to its band: <=.25, <=.35, <.45, <=.65, <.75, <.85, >=.85
+_INDICATOR_TABLE = (
+    ("🔥", "HOT", "OVER", "HIGH"),
+    ("🔥", "HOT", "OVER", "MEDIUM"),
+    ("⚡", "VOLATILE", "AVOID", "HIGH"),
+    ("📊", "STEADY", "NEUTRAL", "LOW"),
+    ("⚡", "VOLATILE", "AVOID", "HIGH"),
+    ("❄️", "COLD", "UNDER", "MEDIUM"),
+    ("❄️", "COLD", "UNDER", "HIGH"),
+)
+_UPPER_INCLUSIVE_EDGES = (0.25, 0.35, 0.65)  # band ends at and including the edge
+_LOWER_INCLUSIVE_EDGES = (0.45, 0.75, 0.85)  # band starts at the edge
+
+def _classify_probs(probs: np.ndarray) -> np.ndarray:
+    """Row of _INDICATOR_TABLE for each regression probability, without per-item branching"""
+    bands = (np.digitize(probs, _UPPER_INCLUSIVE_EDGES, right=True)
+             + np.digitize(probs, _LOWER_INCLUSIVE_EDGES))
+    # NaN fails every comparison in get_performance_indicator and lands on VOLATILE
+    return np.where(np.isnan(probs), 2, bands)
 
 def get_insight_message(regression_prob: float, recent_frequency: float, stat: str, threshold: float) -> str:
     """Generate actionable insight message"""
@@ -64,79 +96,51 @@ def get_insight_message(regression_prob: float, recent_frequency: float, stat: s
     else:
         return f"Unpredictable {stat.lower()} - high variance in recent games"
 
-def create_simple_prediction_card(stat: str, threshold: float, data: Dict[str, Any]) -> None:
+def _card_inputs(data: Dict[str, Any]) -> tuple:
+    """The (regression_prob, recent_frequency) pair a card reads from a prediction dict"""
+    return data.get('weighted_inverse_probability', 0.5), data.get('recent_frequency', 0.5)
+
+def _prediction_card_html(stat: str, threshold: float, regression_prob: float, recent_frequency: float,
+                          indicator: tuple) -> str:
     """
-    Create a user-friendly prediction card
+    HTML for one user-friendly prediction card, so a stat group's cards share one st.markdown call
     
     Args:
         stat: Statistics name (pts, reb, ast, etc.)
         threshold: Threshold value
-        data: Prediction data dictionary
+        regression_prob: Weighted inverse probability for the threshold
+        recent_frequency: Recent hit frequency for the threshold
+        indicator: get_performance_indicator result (an _INDICATOR_TABLE row)
     """
-    # Extract data
-    regression_prob = data.get('weighted_inverse_probability', 0.5)
-    confidence = data.get('confidence', 'Medium')
-    recent_frequency = data.get('recent_frequency', 0.5)
-    recent_games = data.get('recent_games', 10)
-    
-    # Get indicators
-    indicator_emoji, indicator_text, bet_rec, risk_level = get_performance_indicator(
-        regression_prob, recent_frequency, threshold
-    )
-    conf_emoji, conf_text = get_confidence_level(confidence)
+    indicator_emoji, indicator_text, bet_rec, risk_level = indicator
     
     # Generate insight
     insight = get_insight_message(regression_prob, recent_frequency, stat, threshold)
     
     # Format threshold display
-    stat_display = {
-        'pts': 'Points',
-        'reb': 'Rebounds', 
-        'ast': 'Assists',
-        'fg3m': '3-Pointers Made',
-        'fg3a': '3-Pointers Attempted',
-        'fgm': 'Field Goals Made',
-        'fga': 'Field Goals Attempted',
-        'ftm': 'Free Throws Made',
-        'fta': 'Free Throws Attempted',
-        'stl': 'Steals',
-        'blk': 'Blocks',
-        'tov': 'Turnovers',
-        'pf': 'Personal Fouls'
-    }.get(stat, stat.upper())
-    
-    # Create card
-    with st.container():
-        st.markdown(f"### 🎯 {stat_display} ≥ {int(threshold)}")
-        
-        # Main prediction row
-        col1, col2, col3 = st.columns([2, 1, 1])
-        
-        with col1:
-            if regression_prob >= 0.65:
-                st.markdown(f"**❌ UNLIKELY**")
-            else:
-                st.markdown(f"**✅ LIKELY**")
-        
-        with col2:
-            st.markdown(f"{indicator_emoji} **{indicator_text}**")
-        
-        with col3:
-            if bet_rec == "OVER":
-                st.markdown(f"💡 **BET: {bet_rec}**")
-            elif bet_rec == "UNDER":
-                st.markdown(f"💡 **BET: {bet_rec}**")
-            elif bet_rec == "NEUTRAL":
-                st.markdown(f"💡 **{bet_rec}**")
-            else:
-                st.markdown(f"💡 **{bet_rec}**")
-        
-        # Details row removed - keeping it simple
-        
-        # Insight message
-        st.info(f"💡 {insight}")
-        
-        st.divider()
+    stat_display = _STAT_DISPLAY.get(stat, stat.upper())
+    
+    likely_text = "❌ UNLIKELY" if regression_prob >= 0.65 else "✅ LIKELY"
+    bet_text = f"BET: {bet_rec}" if bet_rec in ("OVER", "UNDER") else bet_rec
+    
+    # Whole card as one HTML block (header, three-column row, insight, divider)
+    # instead of a container with seven separate Streamlit elements
+    return "".join((
+        '<div style="margin-bottom: 1rem;">',
+        f'<h3 style="margin: 0 0 0.5rem 0;">🎯 {html.escape(stat_display)} ≥ {int(threshold)}</h3>',
+        '<div style="display: grid; grid-template-columns: 2fr 1fr 1fr; gap: 1rem; margin-bottom: 0.75rem;">',
+        f'<div><strong>{likely_text}</strong></div>',
+        f'<div>{indicator_emoji} <strong>{indicator_text}</strong></div>',
+        f'<div>💡 <strong>{bet_text}</strong></div>',
+        '</div>',
+        # Translucent tint with inherited text colour, so the box reads in light and dark themes
+        '<div style="padding: 0.75rem 1rem; border-radius: 0.5rem; '
+        'background-color: rgba(28, 131, 225, 0.1);">',
+        f'💡 {html.escape(insight)}',
+        '</div>',
+        '</div>',
+        '<hr>',
+    ))
 
 def show_simple_predictions(probability_results: Dict[str, Dict]) -> None:
     """
@@ -152,20 +156,31 @@ def show_simple_predictions(probability_results: Dict[str, Dict]) -> None:
     st.subheader("🎯 Next Game Predictions")
     st.caption("Simple, actionable insights for betting and fantasy decisions")
     
-    # Group predictions by stat
-    for stat, thresholds in probability_results.items():
-        if not thresholds:
-            continue
-            
-        st.markdown(f"#### {stat.upper()} Predictions")
-        
-        # Sort thresholds for better display
-        sorted_thresholds = sorted(thresholds.items(), key=lambda x: x[0])
-        
-        for threshold, data in sorted_thresholds:
-            create_simple_prediction_card(stat, threshold, data)
-        
-        st.markdown("---")
+    # Group predictions by stat, sorting thresholds for better display; each card's
+    # inputs are read from its dict once and unpacked as a tuple from then on
+    groups = [
+        (stat, [(threshold, *_card_inputs(data))
+                for threshold, data in sorted(thresholds.items(), key=lambda x: x[0])])
+        for stat, thresholds in probability_results.items()
+        if thresholds
+    ]
+    
+    # Classify every card's probability in one batch
+    probs = np.array([
+        regression_prob
+        for _, rows in groups
+        for _, regression_prob, _ in rows
+    ], dtype=np.float64)
+    indicator_rows = iter(_classify_probs(probs).tolist())
+    
+    # One markdown element per stat group: heading, every threshold's card, closing rule
+    for stat, rows in groups:
+        cards = "".join(
+            _prediction_card_html(stat, threshold, regression_prob, recent_frequency,
+                                  _INDICATOR_TABLE[next(indicator_rows)])
+            for threshold, regression_prob, recent_frequency in rows
+        )
+        st.markdown(f"#### {stat.upper()} Predictions\n\n{cards}\n\n---", unsafe_allow_html=True)
 
 def show_betting_summary(probability_results: Dict[str, Dict]) -> None:
     """
@@ -176,46 +191,36 @@ def show_betting_summary(probability_results: Dict[str, Dict]) -> None:
     
     st.subheader("🎰 Quick Betting Guide")
     
-    recommendations = []
-    
-    for stat, thresholds in probability_results.items():
-        for threshold, data in probability_results[stat].items():
-            regression_prob = data.get('weighted_inverse_probability', 0.5)
-            confidence = data.get('confidence', 'Medium')
-            
-            if regression_prob >= 0.75:  # Strong UNDER bet
-                recommendations.append({
-                    'type': 'UNDER',
-                    'stat': stat,
-                    'threshold': threshold,
-                    'confidence': regression_prob,
-                    'strength': 'STRONG' if regression_prob >= 0.85 else 'MODERATE'
-                })
-            elif regression_prob <= 0.35:  # Strong OVER bet
-                recommendations.append({
-                    'type': 'OVER', 
-                    'stat': stat,
-                    'threshold': threshold,
-                    'confidence': 1 - regression_prob,
-                    'strength': 'STRONG' if regression_prob <= 0.25 else 'MODERATE'
-                })
-    
-    if recommendations:
-        # Sort by confidence
-        recommendations.sort(key=lambda x: x['confidence'], reverse=True)
+    # One flat pass, then masks and argsort pick the top rows
+    entries = [
+        (stat, threshold, data.get('weighted_inverse_probability', 0.5))
+        for stat, thresholds in probability_results.items()
+        for threshold, data in thresholds.items()
+    ]
+    probs = np.fromiter((prob for _, _, prob in entries), dtype=np.float64, count=len(entries))
+    
+    under_idx = np.flatnonzero(probs >= 0.75)  # Strong UNDER bet
+    over_idx = np.flatnonzero(probs <= 0.35)  # Strong OVER bet
+    
+    if len(under_idx) or len(over_idx):
+        # Most confident first: highest probability for UNDER, lowest for OVER (ties keep input order)
+        top_under = under_idx[np.argsort(-probs[under_idx], kind='stable')[:3]]
+        top_over = over_idx[np.argsort(probs[over_idx], kind='stable')[:3]]
         
         col1, col2 = st.columns(2)
         
         with col1:
             st.markdown("**🔥 Best OVER Bets:**")
-            over_bets = [r for r in recommendations if r['type'] == 'OVER'][:3]
-            for bet in over_bets:
-                st.markdown(f"• {bet['stat'].upper()} ≥ {int(bet['threshold'])} ({bet['strength']})")
+            for i in top_over:
+                stat, threshold, prob = entries[i]
+                strength = 'STRONG' if prob <= 0.25 else 'MODERATE'
+                st.markdown(f"• {stat.upper()} ≥ {int(threshold)} ({strength})")
         
         with col2:
             st.markdown("**❄️ Best UNDER Bets:**")
-            under_bets = [r for r in recommendations if r['type'] == 'UNDER'][:3]
-            for bet in under_bets:
-                st.markdown(f"• {bet['stat'].upper()} ≥ {int(bet['threshold'])} ({bet['strength']})")
+            for i in top_under:
+                stat, threshold, prob = entries[i]
+                strength = 'STRONG' if prob >= 0.85 else 'MODERATE'
+                st.markdown(f"• {stat.upper()} ≥ {int(threshold)} ({strength})")
     else:
         st.info("💡 No strong betting recommendations at current thresholds")
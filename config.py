@@ -1,13 +1,21 @@
 """
 Configuration file for NBA Player Performance Predictor
 Contains all constants, defaults, and configuration parameters
+
+Collections are read-only (tuples and MappingProxyType); .copy() a mapping to get
+a mutable dict.
 """
 
+from types import MappingProxyType
+
 # API Configuration
 API_BASE_URL = "https://api.balldontlie.io/v1"
 API_TIMEOUT = 10
 API_MAX_RETRIES = 3
 API_RATE_LIMIT_BACKOFF_BASE = 2  # Exponential backoff base
+API_RESPONSE_SCHEMA_VER = "api:v1"  # Schema version for cached raw API responses
+PLAYER_INFO_CACHE_TTL = 86400  # Player bio rarely changes (24 hours)
+SEASON_AVERAGES_CACHE_TTL = 6 * 3600  # Season averages update daily (6 hours)
 
 # Database Configuration
 DATABASE_PATH = "nba_cache.db"
@@ -30,22 +38,22 @@ LAMBDA_LATE = 0.08
 LAMBDA_UNKNOWN = 0.04
 
 # Threshold Configurations
-DEFAULT_THRESHOLDS = {
-    'pts': [10, 15, 20, 25, 30],
-    'reb': [4, 6, 8, 10, 12],
-    'ast': [4, 6, 8, 10, 12],
-    'fg3m': [2, 3, 4, 5]
-}
+DEFAULT_THRESHOLDS = MappingProxyType({
+    'pts': (10, 15, 20, 25, 30),
+    'reb': (4, 6, 8, 10, 12),
+    'ast': (4, 6, 8, 10, 12),
+    'fg3m': (2, 3, 4, 5)
+})
 
 # Coefficient of Variation Estimates for Dynamic Thresholds
-CV_ESTIMATES = {
+CV_ESTIMATES = MappingProxyType({
     'pts': 0.35,  # Points typically have ~35% CV
     'reb': 0.40,  # Rebounds ~40% CV
     'ast': 0.50   # Assists ~50% CV (more variable)
-}
+})
 
 # League Average Defaults (2024 season approximation)
-DEFAULT_LEAGUE_AVERAGES = {
+DEFAULT_LEAGUE_AVERAGES = MappingProxyType({
     'pts': 11.5,
     'reb': 4.2,
     'ast': 2.8,
@@ -60,10 +68,10 @@ DEFAULT_LEAGUE_AVERAGES = {
     'fg3_pct_std': 0.112,
     'ft_pct_std': 0.125,
     'min_std': 9.8
-}
+})
 
 # Season Configuration
-AVAILABLE_SEASONS = list(range(2024, 2019, -1))  # [2024, 2023, 2022, 2021, 2020]
+AVAILABLE_SEASONS = tuple(range(2024, 2019, -1))  # (2024, 2023, 2022, 2021, 2020)
 CURRENT_SEASON_DEFAULT = 2024
 
 # UI Configuration
@@ -76,6 +84,7 @@ SIDEBAR_STATE = "expanded"
 RECENT_GAMES_DEFAULT_LIMIT = 20
 RECENT_GAMES_MIN_FOR_CACHE = 5
 RECENT_GAMES_CHART_DISPLAY = 10
+CHART_MAX_POINTS = 500  # Downsample trend charts above this many points (a guard; current logs are shorter)
 
 # Bayesian Smoothing Configuration
 BAYESIAN_PRIOR_ALPHA = 2.0  # Mildly informative prior
@@ -111,22 +120,22 @@ LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 LOG_DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
 
 # Visualization Colors
-CHART_COLORS = {
+CHART_COLORS = MappingProxyType({
     'pts': '#1f77b4',
     'reb': '#ff7f0e',
     'ast': '#2ca02c',
     'fg3m': '#d62728',
     'min': '#9467bd'
-}
+})
 
 # Career Phase Emojis
-CAREER_PHASE_EMOJIS = {
+CAREER_PHASE_EMOJIS = MappingProxyType({
     "early": "🌱",
     "rising": "📈",
     "peak": "⭐",
     "late": "🌅",
     "unknown": "❓"
-}
+})
 
 # Player Filtering
 MIN_GAMES_FOR_LEAGUE_AVG = 20  # Minimum games played to include in league average calculation
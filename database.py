@@ -1,17 +1,28 @@
 import sqlite3
 import json
+import math
 import os
-from datetime import datetime, timedelta
+import threading
+from datetime import datetime, timedelta, timezone
 from typing import Dict, List, Optional
 from contextlib import contextmanager
 import time
 
 
+def _freshness_cutoff(days: int) -> str:
+    """UTC timestamp `days` ago, in the format CURRENT_TIMESTAMP writes to last_updated"""
+    return (datetime.now(timezone.utc) - timedelta(days=days)).strftime('%Y-%m-%d %H:%M:%S')
+
+
 class NBADatabase:
     """SQLite database for caching NBA player data and reducing API calls"""
 
     def __init__(self, db_path: str = "nba_cache.db"):
         self.db_path = db_path
+        # One long-lived connection per instance, opened on first use and shared
+        # across threads; the lock keeps each caller's statements and commit together
+        self._conn = None
+        self._conn_lock = threading.RLock()
         self._init_database()
 
     def _init_database(self):
@@ -183,24 +194,81 @@ class NBADatabase:
             if 'postseason' not in game_stats_columns:
                 cursor.execute("ALTER TABLE game_stats ADD COLUMN postseason INTEGER DEFAULT 0")
 
+            # Lookup indexes, created after the migrations (which may add the columns).
+            # The season_stats and prediction_metrics lookups already use the indexes
+            # behind their UNIQUE constraints
+
+            # Covering index for get_game_stats: both branches read the game log
+            # straight from the index in date order without touching the table
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_game_stats_cover
+                ON game_stats(player_id, postseason, game_date DESC, season, last_updated,
+                              game_id, pts, reb, ast, fg_pct, fg3m, min)
+            """)
+
+            # get_unverified_predictions and the per-player get_recent_predictions
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_predictions_unverified
+                ON predictions(verified_at, game_date)
+            """)
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_predictions_player
+                ON predictions(player_id, created_at DESC)
+            """)
+
+            # get_favorites reads favorites newest-first straight from this index
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_favorites_order
+                ON favorites(added_date DESC, player_id, player_name)
+            """)
+
             conn.commit()
 
-    @contextmanager
-    def _get_connection(self):
-        """Context manager for database connections with security settings"""
-        conn = sqlite3.connect(self.db_path, timeout=10.0, check_same_thread=False)
+    def _connect(self) -> sqlite3.Connection:
+        """Open the shared connection and apply the per-connection settings once"""
+        # Room for every statement this class issues, so the shared connection
+        # prepares each SQL string once and reuses it from then on
+        conn = sqlite3.connect(self.db_path, timeout=10.0, check_same_thread=False,
+                               cached_statements=256)
         conn.row_factory = sqlite3.Row
         
         # Enable WAL mode for better concurrency
         conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA mmap_size=268435456")  # 256MB
+        conn.execute("PRAGMA cache_size=-20000")  # ~20MB page cache
         
         # Security: Limit database size
         conn.execute("PRAGMA max_page_count=100000")  # ~400MB limit
         
-        try:
-            yield conn
-        finally:
-            conn.close()
+        return conn
+
+    @contextmanager
+    def _get_connection(self):
+        """Context manager yielding the shared connection (kept open between calls)"""
+        with self._conn_lock:
+            if self._conn is None:
+                self._conn = self._connect()
+            conn = self._conn
+            try:
+                yield conn
+            except Exception:
+                # Don't leave a half-done transaction for the next caller to commit
+                conn.rollback()
+                raise
+            else:
+                # A method that returned without committing would otherwise keep the
+                # write lock on the shared connection and block every other writer
+                if conn.in_transaction:
+                    conn.rollback()
+
+    def close(self):
+        """Close the shared connection; the next call reopens it"""
+        with self._conn_lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
 
     def cache_player(self, player_data: Dict):
         """Cache player information"""
@@ -232,8 +300,8 @@ class NBADatabase:
             cursor.execute(
                 """
                 SELECT * FROM players 
-                WHERE id = ? AND last_updated > datetime('now', '-7 days')
-            """, (player_id, ))
+                WHERE id = ? AND last_updated > ?
+            """, (player_id, _freshness_cutoff(7)))
 
             row = cursor.fetchone()
 
@@ -265,9 +333,9 @@ class NBADatabase:
                 """
                 SELECT * FROM players 
                 WHERE (first_name LIKE ? OR last_name LIKE ?)
-                AND last_updated > datetime('now', '-7 days')
+                AND last_updated > ?
                 LIMIT 10
-            """, (search_pattern, search_pattern))
+            """, (search_pattern, search_pattern, _freshness_cutoff(7)))
 
             rows = cursor.fetchall()
 
@@ -300,8 +368,8 @@ class NBADatabase:
                 """
                 SELECT * FROM season_stats 
                 WHERE player_id = ? AND season = ? AND postseason = ?
-                AND last_updated > datetime('now', '-1 day')
-            """, (player_id, season, 1 if postseason else 0))
+                AND last_updated > ?
+            """, (player_id, season, 1 if postseason else 0, _freshness_cutoff(1)))
 
             row = cursor.fetchone()
 
@@ -323,23 +391,27 @@ class NBADatabase:
 
     def cache_game_stats(self, player_id: int, games: List[Dict], postseason: bool = False):
         """Cache game statistics"""
+        postseason_flag = 1 if postseason else 0
+        rows = [
+            (player_id, game_data.get('id'), game_data.get('date'),
+             game_data.get('season'), postseason_flag, game.get('pts'), game.get('reb'),
+             game.get('ast'), game.get('fg_pct'), game.get('fg3m'),
+             game.get('min'))
+            for game in games
+            for game_data in (game.get('game', {}),)
+        ]
+
         with self._get_connection() as conn:
             cursor = conn.cursor()
 
-            for game in games:
-                game_data = game.get('game', {})
-
-                cursor.execute(
-                    """
-                    INSERT OR REPLACE INTO game_stats
-                    (player_id, game_id, game_date, season, postseason, pts, reb, ast, 
-                     fg_pct, fg3m, min, last_updated)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
-                """,
-                    (player_id, game_data.get('id'), game_data.get('date'),
-                     game_data.get('season'), 1 if postseason else 0, game.get('pts'), game.get('reb'),
-                     game.get('ast'), game.get('fg_pct'), game.get('fg3m'),
-                     game.get('min')))
+            # One prepared statement stepped over every row, committed once
+            cursor.executemany(
+                """
+                INSERT OR REPLACE INTO game_stats
+                (player_id, game_id, game_date, season, postseason, pts, reb, ast, 
+                 fg_pct, fg3m, min, last_updated)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+            """, rows)
 
             conn.commit()
 
@@ -349,27 +421,31 @@ class NBADatabase:
                        season: int = None,
                        postseason: bool = False) -> List[Dict]:
         """Retrieve cached game stats"""
+        cutoff = _freshness_cutoff(1)
+
         with self._get_connection() as conn:
             cursor = conn.cursor()
 
             if season is not None:
                 cursor.execute(
                     """
-                    SELECT * FROM game_stats 
+                    SELECT game_id, game_date, season, pts, reb, ast, fg_pct, fg3m, min
+                    FROM game_stats
                     WHERE player_id = ? AND season = ? AND postseason = ?
-                    AND last_updated > datetime('now', '-1 day')
+                    AND last_updated > ?
                     ORDER BY game_date DESC
                     LIMIT ?
-                """, (player_id, season, 1 if postseason else 0, limit))
+                """, (player_id, season, 1 if postseason else 0, cutoff, limit))
             else:
                 cursor.execute(
                     """
-                    SELECT * FROM game_stats 
+                    SELECT game_id, game_date, season, pts, reb, ast, fg_pct, fg3m, min
+                    FROM game_stats
                     WHERE player_id = ? AND postseason = ?
-                    AND last_updated > datetime('now', '-1 day')
+                    AND last_updated > ?
                     ORDER BY game_date DESC
                     LIMIT ?
-                """, (player_id, 1 if postseason else 0, limit))
+                """, (player_id, 1 if postseason else 0, cutoff, limit))
 
             rows = cursor.fetchall()
 
@@ -418,8 +494,8 @@ class NBADatabase:
                 """
                 SELECT * FROM league_averages 
                 WHERE season = ?
-                AND last_updated > datetime('now', '-7 days')
-            """, (season, ))
+                AND last_updated > ?
+            """, (season, _freshness_cutoff(7)))
 
             row = cursor.fetchone()
 
@@ -515,25 +591,22 @@ class NBADatabase:
 
     def clear_old_cache(self, days: int = 30):
         """Clear cache entries older than specified days"""
+        cutoff = (_freshness_cutoff(days),)
+
         with self._get_connection() as conn:
             cursor = conn.cursor()
 
-            cursor.execute(f"""
-                DELETE FROM players 
-                WHERE last_updated < datetime('now', '-{days} days')
-            """)
-
-            cursor.execute(f"""
-                DELETE FROM season_stats 
-                WHERE last_updated < datetime('now', '-{days} days')
-            """)
-
-            cursor.execute(f"""
-                DELETE FROM game_stats 
-                WHERE last_updated < datetime('now', '-{days} days')
-            """)
+            # All three deletes share the one transaction committed below
+            cursor.execute("DELETE FROM players WHERE last_updated < ?", cutoff)
+            cursor.execute("DELETE FROM season_stats WHERE last_updated < ?", cutoff)
+            cursor.execute("DELETE FROM game_stats WHERE last_updated < ?", cutoff)
 
             conn.commit()
+
+            # Fold the deletions back into the main file and reset the WAL, then let
+            # SQLite refresh its planner statistics for the shrunken tables
+            cursor.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            cursor.execute("PRAGMA optimize")
     
     #  === Prediction Tracking Methods ===
     
@@ -554,7 +627,39 @@ class NBADatabase:
             
             conn.commit()
             return cursor.lastrowid
-    
+
+    def save_predictions_batch(self, rows: List[Dict]) -> List[int]:
+        """
+        Save several predictions in one transaction.
+
+        Each row takes the same keys as save_prediction(). Returns the new
+        prediction IDs in row order; nothing is saved if any row fails.
+        """
+        if not rows:
+            return []
+
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            ids = []
+
+            try:
+                for row in rows:
+                    cursor.execute("""
+                        INSERT INTO predictions
+                        (player_id, player_name, game_date, season, stat_type, threshold,
+                         predicted_probability, prediction_confidence)
+                        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                    """, (row['player_id'], row['player_name'], row['game_date'], row['season'],
+                          row['stat_type'], row['threshold'], row['predicted_probability'],
+                          row['confidence']))
+                    ids.append(cursor.lastrowid)
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+
+            return ids
+
     def check_feedback_rate_limit(self, identifier: str = "anonymous", limit_seconds: int = 60) -> bool:
         """
         Check-only: returns whether feedback can be sent now based on the last_sent timestamp.
@@ -605,39 +710,37 @@ class NBADatabase:
             conn.commit()
     
     def verify_prediction(self, prediction_id: int, actual_value: float):
-        """Verify a prediction with actual game result"""
+        """Verify a prediction with actual game result (False if missing or not gradeable)"""
+        # SQLite stores NaN as NULL, which would turn the graded columns and the
+        # running metrics NULL, so a missing stat line is rejected up front
+        if actual_value is None or math.isnan(actual_value):
+            return False
+        
         with self._get_connection() as conn:
             cursor = conn.cursor()
             
-            # Get prediction details
+            # Grade and update the prediction in one statement: the result is a hit when
+            # actual_value reaches the threshold, and the prediction is correct when that
+            # agrees with the side of 0.5 the predicted probability fell on
             cursor.execute("""
-                SELECT threshold, predicted_probability, stat_type
-                FROM predictions
-                WHERE id = ?
-            """, (prediction_id,))
+                UPDATE predictions
+                SET actual_value = :actual,
+                    actual_result = :actual >= threshold,
+                    prediction_correct = (predicted_probability > 0.5) = (:actual >= threshold),
+                    verified_at = CURRENT_TIMESTAMP
+                WHERE id = :id
+                RETURNING stat_type, threshold, prediction_correct
+            """, {'actual': actual_value, 'id': prediction_id})
             
             result = cursor.fetchone()
             if not result:
+                # The UPDATE opened a write transaction even though it matched nothing
+                conn.rollback()
                 return False
             
-            threshold = result['threshold']
-            predicted_prob = result['predicted_probability']
-            stat_type = result['stat_type']
-            
-            # Determine if prediction was correct
-            actual_result = 1 if actual_value >= threshold else 0
-            prediction_correct = 1 if (predicted_prob > 0.5 and actual_result == 1) or (predicted_prob <= 0.5 and actual_result == 0) else 0
-            
-            # Update prediction record
-            cursor.execute("""
-                UPDATE predictions
-                SET actual_value = ?, actual_result = ?, prediction_correct = ?,
-                    verified_at = CURRENT_TIMESTAMP
-                WHERE id = ?
-            """, (actual_value, actual_result, prediction_correct, prediction_id))
-            
             # Update prediction metrics
-            self._update_prediction_metrics(stat_type, threshold, prediction_correct, cursor)
+            self._update_prediction_metrics(result['stat_type'], result['threshold'],
+                                            result['prediction_correct'], cursor)
             
             conn.commit()
             return True
@@ -653,35 +756,18 @@ class NBADatabase:
         else:
             threshold_range = "high"
         
-        # Get current metrics
+        # Start the metrics row at this prediction, or fold it into the existing totals
         cursor.execute("""
-            SELECT total_predictions, correct_predictions
-            FROM prediction_metrics
-            WHERE stat_type = ? AND threshold_range = ?
-        """, (stat_type, threshold_range))
-        
-        row = cursor.fetchone()
-        
-        if row:
-            # Update existing metrics
-            total = row['total_predictions'] + 1
-            correct = row['correct_predictions'] + prediction_correct
-            accuracy = (correct / total) * 100 if total > 0 else 0.0
-            
-            cursor.execute("""
-                UPDATE prediction_metrics
-                SET total_predictions = ?, correct_predictions = ?,
-                    accuracy_rate = ?, last_updated = CURRENT_TIMESTAMP
-                WHERE stat_type = ? AND threshold_range = ?
-            """, (total, correct, accuracy, stat_type, threshold_range))
-        else:
-            # Insert new metrics
-            accuracy = (prediction_correct / 1) * 100
-            cursor.execute("""
-                INSERT INTO prediction_metrics
-                (stat_type, threshold_range, total_predictions, correct_predictions, accuracy_rate)
-                VALUES (?, ?, ?, ?, ?)
-            """, (stat_type, threshold_range, 1, prediction_correct, accuracy))
+            INSERT INTO prediction_metrics
+            (stat_type, threshold_range, total_predictions, correct_predictions, accuracy_rate)
+            VALUES (?, ?, 1, ?, ? * 100.0)
+            ON CONFLICT(stat_type, threshold_range) DO UPDATE SET
+                total_predictions = total_predictions + 1,
+                correct_predictions = correct_predictions + excluded.correct_predictions,
+                accuracy_rate = (correct_predictions + excluded.correct_predictions) * 100.0
+                                / (total_predictions + 1),
+                last_updated = CURRENT_TIMESTAMP
+        """, (stat_type, threshold_range, prediction_correct, prediction_correct))
     
     def get_prediction_accuracy(self, stat_type: str = None) -> List[Dict]:
         """Get prediction accuracy metrics"""
@@ -165,6 +165,13 @@ class InverseFrequencyModel:
         
         return adjusted_results
     
+    @staticmethod
+    def _chronological(games_df: pd.DataFrame, column: str) -> pd.Series:
+        """One column in date order; sorts just that column rather than the whole frame"""
+        if 'date' not in games_df.columns:
+            return games_df[column]
+        return games_df[['date', column]].sort_values('date')[column]
+    
     def analyze_fatigue_curve(self, games_df: pd.DataFrame, window_size: int = 10) -> Dict:
         """
         Analyze fatigue/load curve effects on performance sustainability
@@ -174,11 +181,8 @@ class InverseFrequencyModel:
         if len(games_df) < window_size:
             return {'regression_risk': 0.0, 'sustainability_factor': 1.0}
         
-        # Sort by date
-        df_sorted = games_df.sort_values('date') if 'date' in games_df.columns else games_df
-        
-        # Focus on points for fatigue analysis
-        stat_values = df_sorted['pts'].dropna().values
+        # Focus on points for fatigue analysis, in date order
+        stat_values = self._chronological(games_df, 'pts').dropna().values
         
         if len(stat_values) < window_size:
             return {'regression_risk': 0.0, 'sustainability_factor': 1.0}
@@ -222,9 +226,8 @@ class InverseFrequencyModel:
                 'sustainability_factor': 1.0
             }
         
-        # Sort by date
-        df_sorted = games_df.sort_values('date') if 'date' in games_df.columns else games_df
-        minutes_values = df_sorted['min'].dropna().values
+        # Minutes in date order
+        minutes_values = self._chronological(games_df, 'min').dropna().values
         
         if len(minutes_values) < window_size:
             return {
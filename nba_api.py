@@ -90,6 +90,28 @@ class NBAAPIClient:
         
         return {}
     
+    def _get_cached_response(self, endpoint: str, params: Dict = None, max_age_s: int = config.SEASON_AVERAGES_CACHE_TTL):
+        """
+        Make an idempotent GET request through the persistent sqlite HTTP cache.
+        
+        Returns:
+            Tuple of (response dict, whether it was served from cache)
+        """
+        key = cache_key(f"balldontlie:{endpoint}", params or {}, config.API_RESPONSE_SCHEMA_VER)
+        cached = get_cached(key, max_age_s=max_age_s, schema_ver=config.API_RESPONSE_SCHEMA_VER)
+        if cached is not None:
+            self.cache_hit_count += 1
+            logger.debug(f"Cache hit: {endpoint} with params: {params}")
+            return cached, True
+        
+        response = self._make_request(endpoint, params)
+        if response:
+            try:
+                set_cached(key, response, config.API_RESPONSE_SCHEMA_VER)
+            except Exception as e:
+                logger.warning(f"Failed to cache response for {endpoint}: {e}")
+        return response, False
+    
     def get_api_call_count(self) -> int:
         """Return the number of API calls made in this session"""
         return self.api_call_count
@@ -166,7 +188,9 @@ class NBAAPIClient:
     def get_player_info(self, player_id: int) -> Optional[Dict]:
         """Get detailed player information"""
         try:
-            response = self._make_request(f"players/{player_id}")
+            response, _ = self._get_cached_response(
+                f"players/{player_id}", max_age_s=config.PLAYER_INFO_CACHE_TTL
+            )
             return response.get('data')
         except Exception as e:
             logger.error(f"Error getting player info for player_id {player_id}: {e}", exc_info=True)
@@ -436,14 +460,15 @@ class NBAAPIClient:
                 }
                 
                 try:
-                    response = self._make_request("season_averages", params)
+                    response, from_cache = self._get_cached_response("season_averages", params)
                     data = response.get('data', [])
                     if data:
                         all_seasons.extend(data)
                 except:
                     pass  # Skip seasons with no data
-                
-                time.sleep(0.1)  # Rate limiting
+                else:
+                    if not from_cache:
+                        time.sleep(0.1)  # Rate limiting only applies to real API calls
             
             return all_seasons
             
@@ -647,7 +672,7 @@ class NBAAPIClient:
         key = cache_key(namespace, {}, "teams:v1")
         
         # Try cache first (24 hour TTL for teams - they rarely change)
-        cached = get_cached(key, max_age_s=86400)
+        cached = get_cached(key, max_age_s=86400, schema_ver="teams:v1")
         if cached:
             logger.debug("Cache hit: teams data")
             return cached.get("teams", [])
@@ -51,6 +51,41 @@ class StatisticsEngine:
         
         return result
     
+    def calculate_z_scores_dict(self, player_stats: Dict, league_averages: Dict) -> Dict:
+        """Calculate z-scores for a single row of player stats without building a DataFrame"""
+        result = dict(player_stats)
+        
+        stats_to_normalize = [
+            stat for stat in ['pts', 'reb', 'ast', 'fg_pct', 'fg3_pct', 'ft_pct', 'min']
+            if stat in player_stats and f'{stat}_std' in league_averages
+        ]
+        if not stats_to_normalize:
+            return result
+        
+        values = np.array([
+            self._parse_minutes(player_stats[stat]) if stat == 'min' else self._to_float(player_stats[stat])
+            for stat in stats_to_normalize
+        ])
+        means = np.array([league_averages[stat] for stat in stats_to_normalize], dtype=float)
+        stds = np.array([league_averages[f'{stat}_std'] for stat in stats_to_normalize], dtype=float)
+        
+        with np.errstate(divide='ignore', invalid='ignore'):
+            z_scores = np.where(stds > 0, (values - means) / stds, 0.0)
+        
+        for stat, value, z in zip(stats_to_normalize, values, z_scores):
+            result[stat] = float(value)
+            result[f'{stat}_z'] = float(z)
+        
+        return result
+    
+    @staticmethod
+    def _to_float(value) -> float:
+        """Convert an API value to float, using NaN for missing or invalid values"""
+        try:
+            return float(value)
+        except (ValueError, TypeError):
+            return np.nan
+    
     def _parse_minutes(self, min_value):
         """Parse minutes from MM:SS format to decimal"""
         if not min_value:
@@ -218,6 +253,75 @@ class StatisticsEngine:
         
         return outliers.tolist()
     
+    def downsample_lttb(self, x, y, n_out: int = config.CHART_MAX_POINTS) -> np.ndarray:
+        """
+        Select indices of points to plot using Largest-Triangle-Three-Buckets.
+        
+        Keeps the visual shape of a series while sending at most n_out points
+        to the browser. Returns all indices when the series is already small.
+        """
+        n = len(y)
+        if n <= n_out or n_out < 3:
+            return np.arange(n)
+        
+        x = np.asarray(x, dtype=np.float64)
+        y = np.asarray(y, dtype=np.float64)
+        
+        # First and last points are always kept; the rest are split into buckets
+        edges = np.linspace(1, n - 1, n_out - 1).astype(int)
+        indices = np.empty(n_out, dtype=np.int64)
+        indices[0] = 0
+        indices[-1] = n - 1
+        
+        selected = 0
+        for i in range(n_out - 2):
+            start, end = edges[i], edges[i + 1]
+            
+            # Average of the next bucket (or the last point for the final bucket)
+            next_end = edges[i + 2] if i + 2 < len(edges) else n
+            avg_x = x[end:next_end].mean()
+            avg_y = y[end:next_end].mean()
+            
+            # Pick the point forming the largest triangle with the previous pick
+            areas = np.abs(
+                (x[selected] - avg_x) * (y[start:end] - y[selected])
+                - (x[selected] - x[start:end]) * (avg_y - y[selected])
+            )
+            selected = start + int(np.argmax(areas))
+            indices[i + 1] = selected
+        
+        return indices
+    
+    def downsample_m4(self, x, y, n_buckets: int = config.CHART_MAX_POINTS // 4) -> np.ndarray:
+        """
+        Select indices of points to plot using M4 (first/min/max/last per bucket).
+        
+        Splits the x range into n_buckets equal intervals and keeps the first,
+        last, minimum and maximum point of each, so spikes are never dropped.
+        Expects x sorted ascending. Returns all indices when the series is small.
+        """
+        n = len(y)
+        if n <= 4 * n_buckets:
+            return np.arange(n)
+        
+        x = np.asarray(x, dtype=np.float64)
+        y = np.asarray(y, dtype=np.float64)
+        
+        span = x[-1] - x[0]
+        if span <= 0:
+            return np.array([0, n - 1])
+        
+        buckets = np.minimum(((x - x[0]) / span * n_buckets).astype(np.int64), n_buckets - 1)
+        starts = np.flatnonzero(np.r_[True, buckets[1:] != buckets[:-1]])
+        ends = np.r_[starts[1:], n]
+        
+        keep = []
+        for start, end in zip(starts, ends):
+            segment = y[start:end]
+            keep.extend((start, start + int(np.argmin(segment)), start + int(np.argmax(segment)), end - 1))
+        
+        return np.unique(keep)
+    
     def calculate_consistency_metrics(self, games_data: pd.DataFrame) -> Dict:
         """Calculate various consistency metrics for player performance"""
         metrics = {}
@@ -0,0 +1,275 @@
+"""
+Unit tests for the SQLite cache (database.py)
+Tests the NBADatabase prediction, cache and connection methods
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+from database import NBADatabase
+
+
+def prediction_row(**overrides) -> dict:
+    """A save_prediction() argument dict, with any fields overridden"""
+    row = {
+        'player_id': 1,
+        'player_name': 'Test Player',
+        'game_date': '2025-01-15',
+        'season': 2024,
+        'stat_type': 'pts',
+        'threshold': 20,
+        'predicted_probability': 0.62,
+        'confidence': 'High'
+    }
+    row.update(overrides)
+    return row
+
+
+class DatabaseTestCase(unittest.TestCase):
+    """Base class giving each test a throwaway NBADatabase"""
+
+    def setUp(self):
+        """Set up a throwaway database"""
+        self.tmp_dir = tempfile.mkdtemp()
+        self.db = NBADatabase(os.path.join(self.tmp_dir, "test.db"))
+
+    def tearDown(self):
+        self.db.close()
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+
+class TestPredictionStorage(DatabaseTestCase):
+    """Test cases for saving predictions"""
+
+    def setUp(self):
+        """Set up a throwaway database and a prediction row"""
+        super().setUp()
+        self.row = prediction_row()
+
+    def test_save_predictions_batch(self):
+        """Test that a batch returns one ID per row, in order"""
+        rows = [self.row, prediction_row(stat_type='reb', threshold=8),
+                prediction_row(stat_type='ast', threshold=6)]
+
+        ids = self.db.save_predictions_batch(rows)
+
+        self.assertEqual(len(ids), 3)
+        self.assertEqual(ids, sorted(ids))
+
+        saved = self.db.get_recent_predictions(player_id=1, limit=10)
+        self.assertEqual({p['id'] for p in saved}, set(ids))
+
+    def test_save_predictions_batch_matches_single_save(self):
+        """Test that batch rows are stored like save_prediction rows"""
+        single_id = self.db.save_prediction(**self.row)
+        batch_id = self.db.save_predictions_batch([self.row])[0]
+
+        saved = {p['id']: p for p in self.db.get_recent_predictions(player_id=1, limit=10)}
+        for key in ('stat_type', 'threshold', 'predicted_probability', 'prediction_confidence'):
+            self.assertEqual(saved[single_id][key], saved[batch_id][key])
+
+    def test_save_predictions_batch_empty(self):
+        """Test that an empty batch is a no-op"""
+        self.assertEqual(self.db.save_predictions_batch([]), [])
+
+    def test_save_predictions_batch_rolls_back(self):
+        """Test that a bad row leaves no partial batch behind"""
+        bad_row = dict(self.row)
+        del bad_row['confidence']
+
+        with self.assertRaises(KeyError):
+            self.db.save_predictions_batch([self.row, bad_row])
+
+        self.assertEqual(self.db.get_recent_predictions(player_id=1, limit=10), [])
+
+
+class TestPredictionVerification(DatabaseTestCase):
+    """Test cases for verifying predictions and the accuracy metrics"""
+
+    def setUp(self):
+        """Set up a throwaway database and a prediction row"""
+        super().setUp()
+        self.row = prediction_row()
+
+    def test_verify_prediction(self):
+        """Test that the prediction is graded against the threshold"""
+        hit_id, miss_id = self.db.save_predictions_batch([self.row, self.row])
+
+        self.assertTrue(self.db.verify_prediction(hit_id, 20))
+        self.assertTrue(self.db.verify_prediction(miss_id, 12))
+
+        saved = {p['id']: p for p in self.db.get_recent_predictions(player_id=1, limit=10)}
+        self.assertEqual((saved[hit_id]['actual_result'], saved[hit_id]['prediction_correct']), (1, 1))
+        self.assertEqual((saved[miss_id]['actual_result'], saved[miss_id]['prediction_correct']), (0, 0))
+        self.assertEqual(saved[miss_id]['actual_value'], 12)
+        self.assertIsNotNone(saved[miss_id]['verified_at'])
+
+    def test_verify_unknown_prediction(self):
+        """Test that an unknown prediction ID returns False"""
+        self.assertFalse(self.db.verify_prediction(12345, 20))
+        self.assertEqual(self.db.get_prediction_accuracy(), [])
+
+    def test_verify_missing_actual_value(self):
+        """Test that a NaN or None result is rejected without touching the row or metrics"""
+        prediction_id = self.db.save_prediction(**self.row)
+
+        self.assertFalse(self.db.verify_prediction(prediction_id, float('nan')))
+        self.assertFalse(self.db.verify_prediction(prediction_id, None))
+
+        saved = self.db.get_recent_predictions(player_id=1, limit=10)[0]
+        self.assertIsNone(saved['verified_at'])
+        self.assertEqual(self.db.get_prediction_accuracy(), [])
+
+        self.assertTrue(self.db.verify_prediction(prediction_id, 25))
+        metrics = self.db.get_prediction_accuracy('pts')[0]
+        self.assertEqual((metrics['correct_predictions'], metrics['accuracy_rate']), (1, 100.0))
+
+    def test_accuracy_metrics(self):
+        """Test that metrics accumulate per stat and threshold range"""
+        under = prediction_row(predicted_probability=0.3)
+        ids = self.db.save_predictions_batch([self.row, self.row, under, prediction_row(threshold=5)])
+
+        for prediction_id, actual in zip(ids, (25, 10, 10, 8)):
+            self.db.verify_prediction(prediction_id, actual)
+
+        metrics = {m['threshold_range']: m for m in self.db.get_prediction_accuracy('pts')}
+        self.assertEqual(metrics['high']['total_predictions'], 3)
+        self.assertEqual(metrics['high']['correct_predictions'], 2)
+        self.assertAlmostEqual(metrics['high']['accuracy_rate'], 200 / 3)
+        self.assertEqual(metrics['low']['total_predictions'], 1)
+        self.assertEqual(metrics['low']['accuracy_rate'], 100.0)
+
+
+class TestGameStatsCache(DatabaseTestCase):
+    """Test cases for caching game logs"""
+
+    def setUp(self):
+        """Set up a throwaway database and a short game log"""
+        super().setUp()
+        self.games = [
+            {'game': {'id': 100 + i, 'date': f'2025-01-{10 + i:02d}', 'season': 2024},
+             'pts': 20 + i, 'reb': 5, 'ast': 4, 'fg_pct': 0.5, 'fg3m': 2, 'min': 32}
+            for i in range(5)
+        ]
+
+    def test_cache_game_stats_round_trip(self):
+        """Test that every cached game comes back, newest first"""
+        self.db.cache_game_stats(1, self.games)
+
+        cached = self.db.get_game_stats(1, limit=10, season=2024)
+
+        self.assertEqual([g['game']['id'] for g in cached], [104, 103, 102, 101, 100])
+        self.assertEqual(cached[0]['pts'], 24)
+        self.assertEqual(self.db.get_game_stats(1, limit=10, postseason=True), [])
+
+    def test_cache_game_stats_replaces(self):
+        """Test that re-caching a game overwrites it instead of duplicating it"""
+        self.db.cache_game_stats(1, self.games)
+        self.db.cache_game_stats(1, [dict(self.games[0], pts=40)])
+
+        cached = self.db.get_game_stats(1, limit=10)
+
+        self.assertEqual(len(cached), 5)
+        self.assertEqual(cached[-1]['pts'], 40)
+
+    def test_stale_games_ignored(self):
+        """Test that games cached more than a day ago are treated as missing"""
+        self.db.cache_game_stats(1, self.games)
+        with self.db._get_connection() as conn:
+            conn.execute("UPDATE game_stats SET last_updated = datetime('now', '-25 hours') WHERE game_id = 100")
+            conn.commit()
+
+        cached = self.db.get_game_stats(1, limit=10)
+
+        self.assertEqual([g['game']['id'] for g in cached], [104, 103, 102, 101])
+
+    def test_clear_old_cache(self):
+        """Test that clear_old_cache drops only games older than the cutoff"""
+        self.db.cache_game_stats(1, self.games)
+        with self.db._get_connection() as conn:
+            conn.execute("UPDATE game_stats SET last_updated = datetime('now', '-31 days') WHERE game_id < 102")
+            conn.commit()
+
+        self.db.clear_old_cache(days=30)
+
+        with self.db._get_connection() as conn:
+            remaining = [row[0] for row in conn.execute("SELECT game_id FROM game_stats ORDER BY game_id")]
+        self.assertEqual(remaining, [102, 103, 104])
+
+    def test_cache_game_stats_empty(self):
+        """Test that an empty game list is a no-op"""
+        self.db.cache_game_stats(1, [])
+        self.assertEqual(self.db.get_game_stats(1), [])
+
+
+class TestFavorites(DatabaseTestCase):
+    """Test cases for favorite players"""
+
+    def test_get_favorites_newest_first(self):
+        """Test that favorites come back newest first with the cached team"""
+        self.db.cache_player({'id': 1, 'team': {'abbreviation': 'LAL'}})
+        self.db.add_favorite(1, 'Older Player')
+        with self.db._get_connection() as conn:
+            conn.execute("UPDATE favorites SET added_date = datetime('now', '-1 day')")
+            conn.commit()
+        self.db.add_favorite(2, 'Newer Player')
+
+        self.assertEqual(self.db.get_favorites(), [
+            {'player_id': 2, 'player_name': 'Newer Player', 'team_abbreviation': 'N/A'},
+            {'player_id': 1, 'player_name': 'Older Player', 'team_abbreviation': 'LAL'},
+        ])
+
+
+class TestConnectionReuse(DatabaseTestCase):
+    """Test cases for the shared connection"""
+
+    def test_connection_reused(self):
+        """Test that consecutive calls share one connection"""
+        with self.db._get_connection() as first:
+            pass
+        self.db.add_favorite(1, 'Test Player')
+        with self.db._get_connection() as second:
+            pass
+
+        self.assertIs(first, second)
+        self.assertTrue(self.db.is_favorite(1))
+
+    def test_close_reopens(self):
+        """Test that the database is usable again after close()"""
+        self.db.add_favorite(1, 'Test Player')
+        self.db.close()
+        self.db.close()
+
+        self.assertTrue(self.db.is_favorite(1))
+
+    def test_failed_call_rolls_back(self):
+        """Test that an exception inside a call discards its uncommitted writes"""
+        with self.assertRaises(RuntimeError):
+            with self.db._get_connection() as conn:
+                conn.execute("INSERT INTO favorites (player_id, player_name) VALUES (1, 'Test Player')")
+                raise RuntimeError("boom")
+
+        self.assertFalse(self.db.is_favorite(1))
+
+    def test_uncommitted_call_releases_write_lock(self):
+        """Test that a call returning without commit doesn't block writers on another connection"""
+        with self.db._get_connection() as conn:
+            conn.execute("INSERT INTO favorites (player_id, player_name) VALUES (1, 'Test Player')")
+
+        self.assertFalse(self.db.is_favorite(1))
+
+    def test_unknown_verification_releases_write_lock(self):
+        """Test that verifying an unknown ID leaves the file writable from a second instance"""
+        self.assertFalse(self.db.verify_prediction(-1, 1.0))
+
+        other = NBADatabase(self.db.db_path)
+        try:
+            other.add_favorite(2, 'Other Player')
+            self.assertTrue(self.db.is_favorite(2))
+        finally:
+            other.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,87 @@
+"""
+Unit tests for the lambda advisor (components/lambda_advisor.py)
+Tests calculate_optimal_lambda and its game-log parsing
+"""
+
+import unittest
+from components.lambda_advisor import calculate_optimal_lambda
+
+
+class TestCalculateOptimalLambda(unittest.TestCase):
+    """Test cases for calculate_optimal_lambda"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        # Steady scorer playing steady minutes
+        self.steady_games = [{'pts': 20 + (i % 3), 'min': '32:30'} for i in range(12)]
+
+    def advise(self, recent_games, career_phase='peak', seasons=5):
+        return calculate_optimal_lambda({}, [{}] * seasons, recent_games, {}, career_phase)
+
+    def test_low_variance(self):
+        """Test that consistent scoring adds no variance adjustment"""
+        result = self.advise(self.steady_games)
+
+        self.assertEqual(result['adjustments']['variance'], 0)
+        self.assertIn("Low variance", result['reasoning'])
+        self.assertEqual(result['recommended'], 0.05)
+
+    def test_high_variance(self):
+        """Test that a coefficient of variation above 0.4 increases decay"""
+        games = [{'pts': pts, 'min': '30:00'} for pts in [5, 40, 8, 35, 6, 38, 10, 30, 4, 42]]
+        result = self.advise(games)
+
+        self.assertEqual(result['adjustments']['variance'], 0.03)
+        self.assertIn("High variance", result['reasoning'])
+
+    def test_non_numeric_points_are_skipped(self):
+        """Test that missing or non-numeric points don't count toward the 10-game minimum"""
+        games = [dict(game) for game in self.steady_games]
+        for game in games[:3]:
+            game['pts'] = None
+        games[3]['pts'] = 'n/a'
+
+        result = self.advise(games)
+
+        self.assertEqual(result['adjustments']['variance'], 0)
+        self.assertNotIn("variance", result['reasoning'])
+
+    def test_load_management(self):
+        """Test that three or more DNPs are flagged as load management"""
+        games = [dict(game) for game in self.steady_games]
+        for game in games[:3]:
+            game['min'] = '0:00'
+
+        result = self.advise(games)
+
+        self.assertEqual(result['adjustments']['load_management'], 0.04)
+        self.assertIn("3 DNPs", result['reasoning'])
+
+    def test_minutes_declining(self):
+        """Test that the last five games well under the average increase decay"""
+        games = [{'pts': 20, 'min': 36} for _ in range(10)] + [{'pts': 20, 'min': 12} for _ in range(5)]
+
+        result = self.advise(games)
+
+        self.assertEqual(result['adjustments']['load_management'], 0.02)
+        self.assertIn("Minutes declining", result['reasoning'])
+
+    def test_too_few_games(self):
+        """Test that fewer than 10 games skip the game-log factors"""
+        result = self.advise(self.steady_games[:9])
+
+        self.assertEqual(result['adjustments']['variance'], 0)
+        self.assertEqual(result['adjustments']['load_management'], 0)
+
+    def test_bounds(self):
+        """Test that the recommendation stays within [0.01, 0.25]"""
+        games = [{'pts': pts, 'min': '0:00'} for pts in [5, 40, 8, 35, 6, 38, 10, 30, 4, 42]]
+        result = self.advise(games, career_phase='late', seasons=16)
+
+        self.assertLessEqual(result['recommended'], 0.25)
+        self.assertGreaterEqual(result['recommended'], 0.01)
+        self.assertEqual(result['late'], result['recommended'])
+
+
+if __name__ == '__main__':
+    unittest.main()
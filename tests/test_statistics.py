@@ -55,6 +55,19 @@ class TestStatisticsEngine(unittest.TestCase):
         self.assertGreater(result['reb_z'].iloc[0], 0)
         self.assertGreater(result['ast_z'].iloc[0], 0)
     
+    def test_z_score_dict_matches_dataframe(self):
+        """Test dict z-scores match the DataFrame implementation"""
+        stats = {'pts': '25.3', 'reb': 10.2, 'ast': 8.5, 'fg_pct': 0.485,
+                 'fg3_pct': 0.380, 'ft_pct': 0.850, 'min': '36:30', 'games_played': 70}
+        result = self.engine.calculate_z_scores_dict(stats, self.league_averages)
+        expected = self.engine.calculate_z_scores(pd.DataFrame([stats]), self.league_averages)
+        
+        for stat in ['pts', 'reb', 'ast', 'fg_pct', 'fg3_pct', 'ft_pct', 'min']:
+            self.assertAlmostEqual(result[f'{stat}_z'], expected[f'{stat}_z'].iloc[0], places=6)
+        
+        # Non-normalized fields pass through unchanged
+        self.assertEqual(result['games_played'], 70)
+    
     def test_league_averages_caching(self):
         """Test league averages are cached properly"""
         # First call
@@ -208,6 +221,41 @@ class TestStatisticsEngine(unittest.TestCase):
         
         # Original columns should still exist
         self.assertIn('pts', result.columns)
+    
+    def test_downsample_lttb(self):
+        """Test LTTB downsampling keeps endpoints and peaks"""
+        x = np.arange(2000)
+        y = np.sin(x / 50.0)
+        y[1234] = 10.0  # Spike that must survive downsampling
+        
+        indices = self.engine.downsample_lttb(x, y, n_out=200)
+        
+        self.assertEqual(len(indices), 200)
+        self.assertEqual(indices[0], 0)
+        self.assertEqual(indices[-1], 1999)
+        self.assertIn(1234, indices)
+        self.assertTrue(np.all(np.diff(indices) > 0))
+    
+    def test_downsample_m4(self):
+        """Test M4 keeps bucket extremes and endpoints"""
+        x = np.arange(1000)
+        y = np.random.RandomState(0).normal(30, 5, 1000)
+        y[421] = 60.0
+        y[777] = 0.0
+        
+        indices = self.engine.downsample_m4(x, y, n_buckets=50)
+        
+        self.assertLessEqual(len(indices), 200)
+        self.assertEqual(indices[0], 0)
+        self.assertEqual(indices[-1], 999)
+        self.assertIn(421, indices)
+        self.assertIn(777, indices)
+        self.assertEqual(self.engine.downsample_m4(x[:100], y[:100], n_buckets=50).tolist(), list(range(100)))
+    
+    def test_downsample_lttb_small_series(self):
+        """Test short series are returned unchanged"""
+        indices = self.engine.downsample_lttb([1, 2, 3], [4, 5, 6], n_out=200)
+        np.testing.assert_array_equal(indices, [0, 1, 2])
 
 
 if __name__ == '__main__':